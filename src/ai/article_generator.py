@@ -1,11 +1,71 @@
 """AI-powered article generation for outage summaries."""
 
-from typing import List, Optional, Dict
+from collections import OrderedDict
+import asyncio
+import hashlib
+import random
+from typing import List, Optional, Tuple
 import logging
+import time
+import httpx
 from src.models import ChangeEvent
 from src.ai.config import AIConfig
 from src.utils.logger import get_logger
 
+# Transient provider errors worth retrying with backoff
+_RETRYABLE_ERRORS: tuple = (httpx.TransportError, asyncio.TimeoutError)
+
+try:
+    from openai import AsyncOpenAI
+    from openai import APIConnectionError as _OpenAIConnectionError
+    from openai import RateLimitError as _OpenAIRateLimitError
+    _RETRYABLE_ERRORS += (_OpenAIConnectionError, _OpenAIRateLimitError)
+except ImportError:
+    AsyncOpenAI = None
+
+try:
+    from anthropic import AsyncAnthropic
+    from anthropic import APIConnectionError as _AnthropicConnectionError
+    from anthropic import RateLimitError as _AnthropicRateLimitError
+    _RETRYABLE_ERRORS += (_AnthropicConnectionError, _AnthropicRateLimitError)
+except ImportError:
+    AsyncAnthropic = None
+
+try:
+    # Usa o SDK recomendado 'google-genai'
+    from google import genai as _genai
+except ImportError:
+    _genai = None
+
+_PROVIDER_FACTORIES = {
+    "openai": lambda config, http_client: AsyncOpenAI(
+        api_key=config.api_key, http_client=http_client, timeout=config.timeout
+    ),
+    "anthropic": lambda config, http_client: AsyncAnthropic(
+        api_key=config.api_key, http_client=http_client, timeout=config.timeout
+    ),
+    "gemini": lambda config, http_client: _genai.Client(api_key=config.api_key),
+}
+_PROVIDER_AVAILABLE = {
+    "openai": AsyncOpenAI is not None,
+    "anthropic": AsyncAnthropic is not None,
+    "gemini": _genai is not None,
+}
+# Providers whose SDK accepts our shared httpx connection pool
+_POOLED_PROVIDERS = ("openai", "anthropic")
+
+# Static instructions kept byte-identical across calls so providers can cache the prefix
+SYSTEM_PROMPT = """Atue como um jornalista de tecnologia especializado em infraestrutura.
+Com base nos dados de instabilidade fornecidos, escreva um artigo curto, informativo e objetivo.
+
+Requisitos:
+- 200-300 palavras.
+- Use português do Brasil (pt-BR).
+- Explique o impacto potencial para os usuários.
+- Mencione regiões afetadas se houver dados.
+- Mantenha um tom profissional.
+
+Os dados chegam uma mudança por linha, no formato serviço|tipo|status|relatórios|severidade|horário."""
 
 class AIArticleGenerator:
     """Generates article-style summaries using AI services."""
@@ -13,43 +73,69 @@ class AIArticleGenerator:
     def __init__(self, config: Optional[AIConfig] = None):
         self.config = config or AIConfig()
         self.logger = get_logger("ai_generator")
-        self.cache: Dict[str, str] = {}
+        # LRU of cache key -> (monotonic insert time, article)
+        self.cache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
         self._client = None
+        self._http_client: Optional[httpx.AsyncClient] = None
+        # Circuit breaker state
+        self._consecutive_failures = 0
+        self._skip_until = 0.0
 
-        if not self.config.api_key:
+        if self.config.api_key:
+            self._client = self._create_client()
+        else:
             self.logger.warning("AI API key not configured - article generation disabled")
 
     def _get_client(self):
-        """Get or create AI client."""
-        if self._client is not None:
-            return self._client
+        """Get the AI client (None when unavailable)."""
+        return self._client
+
+    def _create_client(self):
+        """Create the AI client for the configured provider."""
+        provider = self.config.provider
+        factory = _PROVIDER_FACTORIES.get(provider)
+        if factory is None:
+            self.logger.error(f"Unknown AI provider: {provider}")
+            return None
 
-        if not self.config.api_key:
+        if not _PROVIDER_AVAILABLE[provider]:
+            self.logger.error(f"AI library for {provider} not installed")
             return None
 
+        http_client = None
+        if provider in _POOLED_PROVIDERS:
+            self._http_client = http_client = self._create_http_client()
+        return factory(self.config, http_client)
+
+    def _create_http_client(self) -> httpx.AsyncClient:
+        """Create the shared connection pool used by the provider SDK."""
+        return httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=self.config.max_connections,
+                max_keepalive_connections=self.config.max_keepalive,
+            ),
+            timeout=self.config.timeout,
+        )
+
+    async def warmup(self) -> None:
+        """Open the provider connection ahead of the first real request (best effort)."""
+        if self._client is None:
+            return
+
         try:
             if self.config.provider == "openai":
-                from openai import AsyncOpenAI
-                self._client = AsyncOpenAI(api_key=self.config.api_key)
-            
+                await self._client.models.list()
             elif self.config.provider == "anthropic":
-                from anthropic import AsyncAnthropic
-                self._client = AsyncAnthropic(api_key=self.config.api_key)
-            
+                await self._client.messages.create(
+                    model=self.config.model,
+                    max_tokens=1,
+                    messages=[{"role": "user", "content": "ping"}],
+                )
             elif self.config.provider == "gemini":
-                # NOVA MIGRACAO: Usa o SDK recomendado 'google-genai'
-                from google import genai
-                self._client = genai.Client(api_key=self.config.api_key)
-            
-            else:
-                self.logger.error(f"Unknown AI provider: {self.config.provider}")
-                return None
-                
-        except ImportError as e:
-            self.logger.error(f"AI library for {self.config.provider} not installed: {e}")
-            return None
-
-        return self._client
+                await self._client.aio.models.list()
+            self.logger.debug(f"AI client warmed up ({self.config.provider})")
+        except Exception as e:
+            self.logger.debug(f"AI client warmup failed ({self.config.provider}): {e}")
 
     async def generate_article(self, changes: List[ChangeEvent]) -> Optional[str]:
         """Generate an article summary for detected changes."""
@@ -65,9 +151,14 @@ class AIArticleGenerator:
         cache_key = ""
         if self.config.enable_cache:
             cache_key = self._create_cache_key(changes)
-            if cache_key in self.cache:
+            cached = self._cache_get(cache_key)
+            if cached is not None:
                 self.logger.debug("Returning cached article")
-                return self.cache[cache_key]
+                return cached
+
+        if time.monotonic() < self._skip_until:
+            self.logger.debug("AI provider in cooldown after repeated failures, skipping")
+            return None
 
         # Prepare context
         context = self._prepare_context(changes)
@@ -76,62 +167,91 @@ class AIArticleGenerator:
             article = await self._call_ai_service(context)
 
             if article:
-                # Add disclaimer
-                article_with_disclaimer = (
-                    f"{article}\n\n"
-                    f"---\n"
-                    f"*Resumo gerado via IA ({self.config.provider}) com dados do DownDetector.*"
-                )
-
-                # Cache result
-                if self.config.enable_cache and cache_key:
-                    self.cache[cache_key] = article_with_disclaimer
-
                 self.logger.info(f"AI article generated successfully using {self.config.provider}")
-                return article_with_disclaimer
+                return self._finalize_article(article, cache_key)
 
         except Exception as e:
             self.logger.error(f"Failed to generate AI article: {e}")
 
         return None
 
+    def _finalize_article(self, article: str, cache_key: str) -> str:
+        """Add the disclaimer to a generated article and cache it."""
+        article_with_disclaimer = (
+            f"{article}\n\n"
+            f"---\n"
+            f"*Resumo gerado via IA ({self.config.provider}) com dados do DownDetector.*"
+        )
+
+        if self.config.enable_cache and cache_key:
+            self._cache_set(cache_key, article_with_disclaimer)
+
+        return article_with_disclaimer
+
+    def _build_prompt(self, context: str) -> str:
+        """Build the user message for a context string."""
+        return f"Dados:\n{context}\n\nArtigo:"
+
     async def _call_ai_service(self, context: str) -> Optional[str]:
         """Call AI service to generate article."""
-        prompt = f"""
-        Atue como um jornalista de tecnologia especializado em infraestrutura.
-        Com base nos dados de instabilidade abaixo, escreva um artigo curto, informativo e objetivo.
-        
-        Requisitos:
-        - 200-300 palavras.
-        - Use português do Brasil (pt-BR).
-        - Explique o impacto potencial para os usuários.
-        - Mencione regiões afetadas se houver dados.
-        - Mantenha um tom profissional.
-
-        Dados da Instabilidade:
-        {context}
-
-        Artigo:"""
+        prompt = self._build_prompt(context)
+
+        if self.config.provider == "openai":
+            call = self._call_openai
+        elif self.config.provider == "anthropic":
+            call = self._call_anthropic
+        elif self.config.provider == "gemini":
+            call = self._call_gemini
+        else:
+            return None
 
         try:
-            if self.config.provider == "openai":
-                return await self._call_openai(prompt)
-            elif self.config.provider == "anthropic":
-                return await self._call_anthropic(prompt)
-            elif self.config.provider == "gemini":
-                return await self._call_gemini(prompt)
-            else:
-                return None
+            article = await self._call_with_retries(call, prompt)
         except Exception as e:
             self.logger.error(f"AI API call failed ({self.config.provider}): {e}")
+            self._record_failure()
             return None
 
+        self._consecutive_failures = 0
+        return article
+
+    async def _call_with_retries(self, call, prompt: str) -> Optional[str]:
+        """Run a provider call, retrying transient errors with jittered backoff."""
+        for attempt in range(self.config.retry_attempts):
+            try:
+                return await call(prompt)
+            except _RETRYABLE_ERRORS as e:
+                if attempt >= self.config.retry_attempts - 1:
+                    raise
+                ceiling = min(
+                    self.config.retry_max_delay_seconds,
+                    self.config.retry_min_delay_seconds * 2 ** attempt,
+                )
+                delay = random.uniform(self.config.retry_min_delay_seconds, ceiling)
+                self.logger.warning(
+                    f"AI API call attempt {attempt + 1} failed ({self.config.provider}): {e}. "
+                    f"Retrying in {delay:.1f}s..."
+                )
+                await asyncio.sleep(delay)
+        return None
+
+    def _record_failure(self) -> None:
+        """Count a failed call and open the circuit after too many in a row."""
+        self._consecutive_failures += 1
+        if self._consecutive_failures >= self.config.failure_threshold:
+            self._skip_until = time.monotonic() + self.config.cooldown_seconds
+            self._consecutive_failures = 0
+            self.logger.warning(
+                f"AI provider {self.config.provider} failed repeatedly, "
+                f"pausing article generation for {self.config.cooldown_seconds}s"
+            )
+
     async def _call_openai(self, prompt: str) -> Optional[str]:
         """Call OpenAI API."""
         response = await self._client.chat.completions.create(
             model=self.config.model,
             messages=[
-                {"role": "system", "content": "You are a technical journalist."},
+                {"role": "system", "content": SYSTEM_PROMPT},
                 {"role": "user", "content": prompt}
             ],
             max_tokens=self.config.max_tokens,
@@ -144,6 +264,7 @@ class AIArticleGenerator:
         response = await self._client.messages.create(
             model=self.config.model,
             max_tokens=self.config.max_tokens,
+            system=SYSTEM_PROMPT,
             messages=[{"role": "user", "content": prompt}],
         )
         return response.content[0].text.strip()
@@ -155,6 +276,7 @@ class AIArticleGenerator:
             model=self.config.model,
             contents=prompt,
             config={
+                "system_instruction": SYSTEM_PROMPT,
                 "temperature": self.config.temperature,
                 "max_output_tokens": self.config.max_tokens,
             }
@@ -162,26 +284,66 @@ class AIArticleGenerator:
         return response.text
 
     def _prepare_context(self, changes: List[ChangeEvent]) -> str:
-        """Prepare context string for AI."""
-        context_parts = []
+        """Prepare a compact context string for AI."""
+        # Keep only the newest change per (service, change type)
+        latest = {}
         for change in changes:
-            change_info = [
-                f"Serviço: {change.service_name}",
-                f"Tipo de Mudança: {change.change_type.value}",
-                f"Status Atual: {change.new_status.value}",
-                f"Relatórios de Falha: {change.new_report_count:,}",
-                f"Severidade: {change.new_severity.value}",
-                f"Horário: {change.timestamp.strftime('%H:%M UTC')}",
-            ]
-            context_parts.append("\n".join(change_info))
-        return "\n\n---\n\n".join(context_parts)
+            key = (change.service_name, change.change_type)
+            current = latest.get(key)
+            if current is None or change.timestamp >= current.timestamp:
+                latest[key] = change
+
+        selected = sorted(latest.values(), key=lambda c: c.timestamp)
+        selected = selected[-self.config.max_context_items:]
+
+        lines = ["serviço|tipo|status|relatórios|severidade|horário"]
+        for change in selected:
+            lines.append(
+                f"{change.service_name}|{change.change_type}|{change.new_status}|"
+                f"{change.new_report_count}|{change.new_severity}|"
+                f"{change.timestamp.strftime('%H:%M UTC')}"
+            )
+        return "\n".join(lines)
 
     def _create_cache_key(self, changes: List[ChangeEvent]) -> str:
-        """Create a cache key for changes."""
-        key_parts = [f"{c.service_name}:{c.change_type.value}" for c in changes]
-        return "|".join(sorted(key_parts))
+        """Create a fixed-width cache key for changes."""
+        digest = hashlib.blake2b(digest_size=16)
+        for change in sorted(changes, key=lambda c: (c.service_name, c.change_type)):
+            digest.update(change.service_name.encode())
+            digest.update(b"\x00")
+            digest.update(change.change_type.encode())
+            digest.update(b"\x01")
+        return digest.hexdigest()
+
+    def _cache_get(self, key: str) -> Optional[str]:
+        """Get a cached article if present and not expired."""
+        entry = self.cache.get(key)
+        if entry is None:
+            return None
+
+        created_at, article = entry
+        if time.monotonic() - created_at >= self.config.cache_ttl_seconds:
+            del self.cache[key]
+            return None
+
+        self.cache.move_to_end(key)
+        return article
+
+    def _cache_set(self, key: str, article: str) -> None:
+        """Store an article, evicting the least recently used entries."""
+        self.cache[key] = (time.monotonic(), article)
+        self.cache.move_to_end(key)
+        while len(self.cache) > self.config.cache_max_size:
+            self.cache.popitem(last=False)
 
     def clear_cache(self) -> None:
         """Clear the article cache."""
         self.cache.clear()
         self.logger.debug("AI article cache cleared")
+
+    async def close(self) -> None:
+        """Close the provider connection pool."""
+        if self._http_client:
+            await self._http_client.aclose()
+            self._http_client = None
+            self.logger.debug("AI HTTP client closed")
@@ -12,6 +12,17 @@ class AIConfig(BaseSettings):
     max_tokens: int = 500
     temperature: float = 0.7
     enable_cache: bool = True
+    max_context_items: int = 20
+    cache_max_size: int = 256
+    cache_ttl_seconds: int = 3600
+    max_connections: int = 100
+    max_keepalive: int = 20
+    timeout: float = 60.0
+    retry_attempts: int = 3
+    retry_min_delay_seconds: float = 1.0
+    retry_max_delay_seconds: float = 20.0
+    failure_threshold: int = 3
+    cooldown_seconds: int = 300
 
     class Config:
         env_prefix = "AI_"
@@ -1,6 +1,7 @@
 """Health check endpoints."""
 
 from datetime import datetime
+from typing import Dict
 from fastapi import APIRouter
 
 from src.models import HealthCheckResponse, MetricsResponse
@@ -17,7 +18,7 @@ async def health_check() -> HealthCheckResponse:
 
     Returns system health status and uptime information.
     """
-    return HealthCheckResponse(
+    return HealthCheckResponse.model_construct(
         status="healthy",
         timestamp=datetime.now(),
         version=__version__,
@@ -26,21 +27,12 @@ async def health_check() -> HealthCheckResponse:
 
 
 @router.get("/metrics", response_model=MetricsResponse)
-async def get_metrics() -> MetricsResponse:
+async def get_metrics() -> Dict:
     """
     Get system metrics.
 
     Returns detailed system metrics including scrape statistics,
     notification counts, and uptime information.
     """
-    return MetricsResponse(
-        total_scrapes=metrics.total_scrapes,
-        successful_scrapes=metrics.successful_scrapes,
-        failed_scrapes=metrics.failed_scrapes,
-        total_notifications_sent=metrics.total_notifications_sent,
-        services_monitored=metrics.services_monitored,
-        current_outages=metrics.current_outages,
-        uptime_seconds=metrics.get_uptime_seconds(),
-        success_rate=round(metrics.get_success_rate(), 2),
-        last_scrape=metrics.last_scrape,
-    )
+    # Validated against MetricsResponse and serialized by pydantic
+    return metrics.to_dict()
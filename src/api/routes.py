@@ -1,8 +1,11 @@
 """REST API routes for outage status and changes."""
 
+import os
+from bisect import bisect_left, bisect_right, insort
+from collections import defaultdict
 from datetime import datetime, timedelta
-from typing import Optional, List
-from fastapi import APIRouter, HTTPException, Query, Depends, Request
+from typing import Optional, List, Dict, Set, Tuple
+from fastapi import APIRouter, HTTPException, Query
 
 from src.models import (
     OutageReport,
@@ -16,35 +19,51 @@ from src.middleware.rate_limiter import RateLimiter
 
 router = APIRouter(prefix="/api/v1", tags=["Outage API"])
 
-# Rate limiter instance
-rate_limiter = RateLimiter(requests_per_minute=100)
+# Rate limiter instance, applied by the middleware to these path prefixes
+RATE_LIMITED_PREFIXES = ("/api/v1/status", "/api/v1/changes", "/api/v1/services")
+rate_limiter = RateLimiter(
+    requests_per_minute=int(os.getenv("API_RATE_LIMIT_PER_MINUTE", "100")),
+    storage_uri=os.getenv("API_RATE_LIMIT_STORAGE_URI") or None,
+)
 
 # In-memory storage for current state and changes history
 _current_state: dict = {}
-_changes_history: List[dict] = []
+_current_state_lower: Dict[str, str] = {}
+_by_severity: Dict[SeverityEnum, Set[str]] = {}
+_by_status: Dict[StatusEnum, Set[str]] = {}
+# (epoch timestamp, change dict) pairs kept sorted by timestamp
+_changes_history: List[Tuple[float, dict]] = []
 
 
 def set_current_state(state: dict) -> None:
     """Set current state from scheduler."""
-    global _current_state
+    global _current_state, _current_state_lower, _by_severity, _by_status
     _current_state = state
+    # Index for case-insensitive service lookups
+    _current_state_lower = {name.lower(): name for name in state}
+
+    # Reverse indexes for /status filters
+    by_severity = defaultdict(set)
+    by_status = defaultdict(set)
+    for name, report in state.items():
+        by_severity[report.severity].add(name)
+        by_status[report.status].add(name)
+    _by_severity = dict(by_severity)
+    _by_status = dict(by_status)
 
 
 def add_changes(changes: List[dict]) -> None:
     """Add changes to history."""
-    global _changes_history
-    _changes_history.extend(changes)
-    # Keep only last 24 hours of changes
-    cutoff = datetime.now() - timedelta(hours=24)
-    _changes_history = [
-        c for c in _changes_history
-        if datetime.fromisoformat(c.get("timestamp", "2000-01-01")) > cutoff
-    ]
+    for c in changes:
+        ts = datetime.fromisoformat(c.get("timestamp", "2000-01-01")).timestamp()
+        if not _changes_history or ts >= _changes_history[-1][0]:
+            _changes_history.append((ts, c))
+        else:
+            insort(_changes_history, (ts, c), key=lambda item: item[0])
 
-
-async def check_rate_limit(request: Request):
-    """Dependency for rate limiting."""
-    await rate_limiter.check_rate_limit(request)
+    # Keep only last 24 hours of changes; (ts,) sorts before any (ts, change)
+    cutoff_ts = (datetime.now() - timedelta(hours=24)).timestamp()
+    del _changes_history[:bisect_right(_changes_history, (cutoff_ts,))]
 
 
 @router.get(
@@ -53,25 +72,30 @@ async def check_rate_limit(request: Request):
     responses={429: {"model": ErrorResponse}},
 )
 async def get_all_status(
-    request: Request,
     severity: Optional[SeverityEnum] = Query(None, description="Filter by severity"),
     status: Optional[StatusEnum] = Query(None, description="Filter by status"),
-    _: None = Depends(check_rate_limit),
 ) -> StatusResponse:
     """
     Get current status of all monitored services.
 
     Optionally filter by severity level or status.
     """
-    services = list(_current_state.values())
-
-    # Apply filters
-    if severity:
-        services = [s for s in services if s.severity == severity]
-    if status:
-        services = [s for s in services if s.status == status]
-
-    return StatusResponse(
+    # Apply filters through the reverse indexes
+    if severity and status:
+        names = _by_severity.get(severity, set()) & _by_status.get(status, set())
+    elif severity:
+        names = _by_severity.get(severity, set())
+    elif status:
+        names = _by_status.get(status, set())
+    else:
+        names = None
+
+    if names is None:
+        services = list(_current_state.values())
+    else:
+        services = [_current_state[name] for name in sorted(names)]
+
+    return StatusResponse.model_construct(
         services=services,
         total_count=len(services),
         timestamp=datetime.now(),
@@ -85,8 +109,6 @@ async def get_all_status(
 )
 async def get_service_status(
     service_name: str,
-    request: Request,
-    _: None = Depends(check_rate_limit),
 ) -> OutageReport:
     """
     Get status for a specific service.
@@ -95,10 +117,9 @@ async def get_service_status(
         service_name: Name of the service (case-insensitive)
     """
     # Case-insensitive lookup
-    service_name_lower = service_name.lower()
-    for name, report in _current_state.items():
-        if name.lower() == service_name_lower:
-            return report
+    canonical_name = _current_state_lower.get(service_name.lower())
+    if canonical_name is not None:
+        return _current_state[canonical_name]
 
     raise HTTPException(
         status_code=404,
@@ -119,11 +140,9 @@ async def get_service_status(
     responses={429: {"model": ErrorResponse}},
 )
 async def get_recent_changes(
-    request: Request,
     hours: int = Query(24, ge=1, le=168, description="Hours to look back"),
     service: Optional[str] = Query(None, description="Filter by service name"),
     change_type: Optional[str] = Query(None, description="Filter by change type"),
-    _: None = Depends(check_rate_limit),
 ) -> ChangesResponse:
     """
     Get recent changes in the specified time range.
@@ -133,15 +152,15 @@ async def get_recent_changes(
         service: Optional service name filter
         change_type: Optional change type filter
     """
-    cutoff = datetime.now() - timedelta(hours=hours)
+    now = datetime.now()
+    cutoff = now - timedelta(hours=hours)
+    cutoff_ts = cutoff.timestamp()
+    service_lower = service.lower() if service else None
     changes = []
 
-    for change in _changes_history:
-        change_time = datetime.fromisoformat(change.get("timestamp", "2000-01-01"))
-        if change_time < cutoff:
-            continue
-
-        if service and change.get("service_name", "").lower() != service.lower():
+    start = bisect_left(_changes_history, (cutoff_ts,))
+    for _, change in _changes_history[start:]:
+        if service_lower and change.get("service_name", "").lower() != service_lower:
             continue
 
         if change_type and change.get("change_type") != change_type:
@@ -154,16 +173,13 @@ async def get_recent_changes(
         total_count=len(changes),
         time_range={
             "start": cutoff.isoformat(),
-            "end": datetime.now().isoformat(),
+            "end": now.isoformat(),
         }
     )
 
 
 @router.get("/services")
-async def list_services(
-    request: Request,
-    _: None = Depends(check_rate_limit),
-) -> dict:
+async def list_services() -> dict:
     """
     List all monitored services.
 
@@ -12,6 +12,7 @@ class ChangeDetector:
     """Detects changes between scraping cycles."""
 
     SEVERITY_ORDER = [SeverityEnum.LOW, SeverityEnum.MEDIUM, SeverityEnum.HIGH, SeverityEnum.CRITICAL]
+    SEVERITY_INDEX = {severity: idx for idx, severity in enumerate(SEVERITY_ORDER)}
 
     def __init__(self, config: Optional[DetectorConfig] = None):
         """
@@ -36,51 +37,52 @@ class ChangeDetector:
         """
         changes = []
         current_services = {report.service_name: report for report in current_reports}
+        # One timestamp for the whole cycle keeps the batch consistent
+        now = datetime.now()
 
         self.logger.debug(f"Comparing {len(current_reports)} current reports with {len(self.previous_state)} previous")
 
-        # Check for new outages and changes in existing services
+        # Check for new outages and changes in existing services, in scrape order
         for service_name, report in current_services.items():
-            if service_name not in self.previous_state:
+            old_report = self.previous_state.get(service_name)
+            if old_report is None:
                 # New service detected
                 if report.status != StatusEnum.UP:
                     changes.append(self._create_change_event(
                         ChangeType.NEW_OUTAGE,
                         service_name,
                         None,
-                        report
+                        report,
+                        now
                     ))
                     self.logger.info(f"New outage detected: {service_name}")
             else:
-                # Check for changes in existing service
-                old_report = self.previous_state[service_name]
-                detected_changes = self._compare_reports(old_report, report)
-                changes.extend(detected_changes)
+                changes.extend(self._compare_reports(old_report, report, now))
 
         # Check for resolved outages (services that were in previous state but not in current)
         for service_name, old_report in self.previous_state.items():
-            if service_name not in current_services:
-                if old_report.status != StatusEnum.UP:
-                    # Create a resolved report
-                    resolved_report = OutageReport(
-                        service_name=old_report.service_name,
-                        service_url=old_report.service_url,
-                        status=StatusEnum.UP,
-                        report_count=0,
-                        timestamp=datetime.now(),
-                        severity=SeverityEnum.LOW,
-                        affected_regions=[],
-                    )
-                    changes.append(self._create_change_event(
-                        ChangeType.OUTAGE_RESOLVED,
-                        service_name,
-                        old_report,
-                        resolved_report
-                    ))
-                    self.logger.info(f"Outage resolved: {service_name}")
+            if service_name not in current_services and old_report.status != StatusEnum.UP:
+                # Create a resolved report
+                resolved_report = OutageReport(
+                    service_name=old_report.service_name,
+                    service_url=old_report.service_url,
+                    status=StatusEnum.UP,
+                    report_count=0,
+                    timestamp=now,
+                    severity=SeverityEnum.LOW,
+                    affected_regions=[],
+                )
+                changes.append(self._create_change_event(
+                    ChangeType.OUTAGE_RESOLVED,
+                    service_name,
+                    old_report,
+                    resolved_report,
+                    now
+                ))
+                self.logger.info(f"Outage resolved: {service_name}")
 
-        # Update state
-        self.previous_state = current_services.copy()
+        # Update state (current_services is built here, so no copy is needed)
+        self.previous_state = current_services
 
         self.logger.info(f"Detected {len(changes)} changes")
         return changes
@@ -88,7 +90,8 @@ class ChangeDetector:
     def _compare_reports(
         self,
         old_report: OutageReport,
-        new_report: OutageReport
+        new_report: OutageReport,
+        now: Optional[datetime] = None
     ) -> List[ChangeEvent]:
         """
         Compare two reports and detect changes.
@@ -96,6 +99,7 @@ class ChangeDetector:
         Args:
             old_report: Previous report
             new_report: Current report
+            now: Timestamp for the change events (defaults to now)
 
         Returns:
             List of detected changes
@@ -116,20 +120,22 @@ class ChangeDetector:
                 change_type,
                 service_name,
                 old_report,
-                new_report
+                new_report,
+                now
             ))
 
         # Severity change (only if status hasn't changed to UP)
         if new_report.status != StatusEnum.UP:
-            old_severity_idx = self.SEVERITY_ORDER.index(old_report.severity)
-            new_severity_idx = self.SEVERITY_ORDER.index(new_report.severity)
+            old_severity_idx = self.SEVERITY_INDEX[old_report.severity]
+            new_severity_idx = self.SEVERITY_INDEX[new_report.severity]
 
             if new_severity_idx > old_severity_idx:
                 changes.append(self._create_change_event(
                     ChangeType.SEVERITY_INCREASED,
                     service_name,
                     old_report,
-                    new_report
+                    new_report,
+                    now
                 ))
                 self.logger.info(f"Severity increased: {service_name}")
             elif new_severity_idx < old_severity_idx:
@@ -137,7 +143,8 @@ class ChangeDetector:
                     ChangeType.SEVERITY_DECREASED,
                     service_name,
                     old_report,
-                    new_report
+                    new_report,
+                    now
                 ))
                 self.logger.info(f"Severity decreased: {service_name}")
 
@@ -148,7 +155,8 @@ class ChangeDetector:
                 ChangeType.REPORT_COUNT_SPIKE,
                 service_name,
                 old_report,
-                new_report
+                new_report,
+                now
             ))
             self.logger.info(f"Report count spike: {service_name} (+{count_increase})")
 
@@ -159,7 +167,8 @@ class ChangeDetector:
         change_type: ChangeType,
         service_name: str,
         old_report: Optional[OutageReport],
-        new_report: OutageReport
+        new_report: OutageReport,
+        now: Optional[datetime] = None
     ) -> ChangeEvent:
         """Create a ChangeEvent object."""
         return ChangeEvent(
@@ -171,7 +180,7 @@ class ChangeDetector:
             new_report_count=new_report.report_count,
             old_severity=old_report.severity if old_report else None,
             new_severity=new_report.severity,
-            timestamp=datetime.now(),
+            timestamp=now or datetime.now(),
             service_url=new_report.service_url,
         )
 
@@ -8,10 +8,11 @@ from dotenv import load_dotenv
 
 from src import __version__
 from src.api import api_router, health_router
-from src.api.routes import set_current_state, add_changes
+from src.api.routes import set_current_state, add_changes, rate_limiter, RATE_LIMITED_PREFIXES
 from src.middleware.security import configure_security
 from src.scheduler import OutageMonitorScheduler
 from src.scraper.config import ScraperConfig
+from src.scraper.downdetector_scraper import shutdown_shared_client
 from src.detector.config import DetectorConfig
 from src.notifier.config import EmailConfig
 from src.ai.config import AIConfig
@@ -58,6 +59,12 @@ async def lifespan(app: FastAPI):
     # Start scheduler
     scheduler.start()
 
+    # Establish the AI provider connection before the first article is needed;
+    # keep a reference so the task is not garbage-collected mid-flight
+    app.state.warmup_task = None
+    if scheduler.ai_generator:
+        app.state.warmup_task = asyncio.create_task(scheduler.ai_generator.warmup())
+
     # Setup state update callback
     async def update_state():
         """Periodically update API state from scheduler."""
@@ -79,6 +86,18 @@ async def lifespan(app: FastAPI):
     state_task.cancel()
     scheduler.stop()
     await scheduler.scraper.close()
+    await shutdown_shared_client()
+    warmup_task = app.state.warmup_task
+    if warmup_task:
+        warmup_task.cancel()
+        try:
+            await warmup_task
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.error(f"AI warmup failed: {e}")
+    if scheduler.ai_generator:
+        await scheduler.ai_generator.close()
 
 
 # Create FastAPI application
@@ -93,7 +112,12 @@ app = FastAPI(
 )
 
 # Configure security middleware
-configure_security(app, enable_cors=os.getenv("API_ENABLE_CORS", "true").lower() == "true")
+configure_security(
+    app,
+    enable_cors=os.getenv("API_ENABLE_CORS", "true").lower() == "true",
+    rate_limiter=rate_limiter,
+    rate_limited_prefixes=RATE_LIMITED_PREFIXES,
+)
 
 # Include routers
 app.include_router(health_router, prefix="/api/v1")
@@ -1,23 +1,58 @@
 """Rate limiting middleware for API protection."""
 
-from collections import defaultdict
-from datetime import datetime, timedelta
-from typing import Dict, List
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional
 from fastapi import Request, HTTPException
 
+from src.utils.logger import get_logger
+
 
 class RateLimiter:
-    """Simple in-memory rate limiter."""
+    """Rate limiter, in-memory by default or shared through a ``limits`` storage."""
+
+    WINDOW_SECONDS = 60.0
+    SHARD_COUNT = 16
 
-    def __init__(self, requests_per_minute: int = 100):
+    def __init__(self, requests_per_minute: int = 100, storage_uri: Optional[str] = None):
         """
         Initialize rate limiter.
 
         Args:
             requests_per_minute: Maximum requests allowed per minute per IP
+            storage_uri: Optional ``limits`` storage URI (e.g. ``async+redis://redis:6379``)
+                shared by all workers; in-memory counters are used when omitted
         """
         self.requests_per_minute = requests_per_minute
-        self.requests: Dict[str, List[datetime]] = defaultdict(list)
+        self.logger = get_logger("rate_limiter")
+        self._strategy = None
+        self._item = None
+        if storage_uri:
+            self._configure_storage(storage_uri)
+
+        # Monotonic timestamps per IP, oldest on the left, sharded by IP hash.
+        # The in-memory path never awaits, so it runs atomically on the event loop.
+        self._shards: List[Dict[str, Deque[float]]] = [{} for _ in range(self.SHARD_COUNT)]
+        self._last_sweep = time.monotonic()
+
+    def _configure_storage(self, storage_uri: str) -> None:
+        """Use a shared ``limits`` storage backend for counters."""
+        try:
+            from limits import RateLimitItemPerMinute
+            from limits.aio.strategies import MovingWindowRateLimiter
+            from limits.storage import storage_from_string
+        except ImportError as e:
+            self.logger.error(f"limits library not installed, using in-memory rate limiting: {e}")
+            return
+
+        try:
+            storage = storage_from_string(storage_uri)
+        except Exception as e:
+            self.logger.error(f"Invalid rate limit storage '{storage_uri}', using in-memory: {e}")
+            return
+
+        self._strategy = MovingWindowRateLimiter(storage)
+        self._item = RateLimitItemPerMinute(self.requests_per_minute)
 
     async def check_rate_limit(self, request: Request) -> None:
         """
@@ -32,28 +67,62 @@ class RateLimiter:
         # Get client IP
         client_ip = self._get_client_ip(request)
 
-        # Clean old requests
-        cutoff_time = datetime.now() - timedelta(minutes=1)
-        self.requests[client_ip] = [
-            req_time for req_time in self.requests[client_ip]
-            if req_time > cutoff_time
-        ]
+        if self._strategy is not None:
+            if not await self._strategy.hit(self._item, client_ip):
+                self._raise_limit_exceeded()
+            return
+
+        now = time.monotonic()
+        cutoff = now - self.WINDOW_SECONDS
+
+        # Periodically forget IPs whose window is empty
+        if now - self._last_sweep >= self.WINDOW_SECONDS:
+            self._last_sweep = now
+            self._sweep(cutoff)
+
+        timestamps = self._shards[self._shard_index(client_ip)].setdefault(client_ip, deque())
+
+        # Drop requests that fell out of the window
+        self._prune(timestamps, cutoff)
 
         # Check limit
-        if len(self.requests[client_ip]) >= self.requests_per_minute:
-            raise HTTPException(
-                status_code=429,
-                detail={
-                    "error": {
-                        "code": "RATE_LIMIT_EXCEEDED",
-                        "message": "Rate limit exceeded. Please try again later.",
-                        "retry_after_seconds": 60,
-                    }
-                }
-            )
+        if len(timestamps) >= self.requests_per_minute:
+            self._raise_limit_exceeded()
 
         # Add current request
-        self.requests[client_ip].append(datetime.now())
+        timestamps.append(now)
+
+    @staticmethod
+    def _raise_limit_exceeded() -> None:
+        """Raise the 429 error returned to rate-limited clients."""
+        raise HTTPException(
+            status_code=429,
+            detail={
+                "error": {
+                    "code": "RATE_LIMIT_EXCEEDED",
+                    "message": "Rate limit exceeded. Please try again later.",
+                    "retry_after_seconds": 60,
+                }
+            }
+        )
+
+    def _shard_index(self, client_ip: str) -> int:
+        """Get the shard index for a client IP."""
+        return hash(client_ip) % self.SHARD_COUNT
+
+    def _sweep(self, cutoff: float) -> None:
+        """Delete entries whose newest request is older than the cutoff."""
+        for shard in self._shards:
+            stale = [ip for ip, timestamps in shard.items()
+                     if not timestamps or timestamps[-1] <= cutoff]
+            for ip in stale:
+                del shard[ip]
+
+    @staticmethod
+    def _prune(timestamps: Deque[float], cutoff: float) -> None:
+        """Remove timestamps at or before the cutoff."""
+        while timestamps and timestamps[0] <= cutoff:
+            timestamps.popleft()
 
     def _get_client_ip(self, request: Request) -> str:
         """Get client IP address from request."""
@@ -70,13 +139,14 @@ class RateLimiter:
 
     def reset(self) -> None:
         """Reset all rate limit counters."""
-        self.requests.clear()
+        for shard in self._shards:
+            shard.clear()
 
     def get_remaining(self, client_ip: str) -> int:
-        """Get remaining requests for a client."""
-        cutoff_time = datetime.now() - timedelta(minutes=1)
-        recent_requests = [
-            req_time for req_time in self.requests.get(client_ip, [])
-            if req_time > cutoff_time
-        ]
-        return max(0, self.requests_per_minute - len(recent_requests))
+        """Get remaining requests for a client (in-memory counters only)."""
+        timestamps = self._shards[self._shard_index(client_ip)].get(client_ip)
+        if not timestamps:
+            return self.requests_per_minute
+
+        self._prune(timestamps, time.monotonic() - self.WINDOW_SECONDS)
+        return max(0, self.requests_per_minute - len(timestamps))
@@ -1,17 +1,40 @@
 """Security middleware configuration."""
 
-from fastapi import FastAPI
+from typing import Optional, Tuple
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
+from src.middleware.rate_limiter import RateLimiter
 
-def configure_security(app: FastAPI, enable_cors: bool = True) -> None:
+
+def configure_security(
+    app: FastAPI,
+    enable_cors: bool = True,
+    rate_limiter: Optional[RateLimiter] = None,
+    rate_limited_prefixes: Tuple[str, ...] = (),
+) -> None:
     """
     Configure security middleware for the application.
 
     Args:
         app: FastAPI application instance
         enable_cors: Whether to enable CORS
+        rate_limiter: Optional rate limiter applied as HTTP middleware
+        rate_limited_prefixes: Path prefixes the rate limiter applies to
     """
+    # Registered before CORS so rate limit responses still get CORS headers
+    if rate_limiter is not None and rate_limited_prefixes:
+        async def rate_limit_middleware(request: Request, call_next):
+            if request.url.path.startswith(rate_limited_prefixes):
+                try:
+                    await rate_limiter.check_rate_limit(request)
+                except HTTPException as e:
+                    return JSONResponse(status_code=e.status_code, content={"detail": e.detail})
+            return await call_next(request)
+
+        app.middleware("http")(rate_limit_middleware)
+
     if enable_cors:
         app.add_middleware(
             CORSMiddleware,
@@ -1,6 +1,7 @@
 """Pydantic models for the outage monitoring system."""
 
-from pydantic import BaseModel, HttpUrl, Field
+import msgspec
+from pydantic import BaseModel, ConfigDict, HttpUrl, Field
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from enum import Enum
@@ -14,12 +15,55 @@ class StatusEnum(str, Enum):
 
 
 class SeverityEnum(str, Enum):
-    """Severity level enumeration."""
+    """
+    Severity level enumeration.
+
+    Values stay strings for the API, but levels order from LOW to CRITICAL,
+    also against raw values: ``SeverityEnum.HIGH < "critical"``. Other
+    operands return NotImplemented and fall back to Python's default handling.
+
+    Model fields store the raw string (``use_enum_values``), so two fields
+    compare alphabetically; order them by ``rank`` / ``severity_rank`` instead.
+    """
     LOW = "low"
     MEDIUM = "medium"
     HIGH = "high"
     CRITICAL = "critical"
 
+    @property
+    def rank(self) -> int:
+        """Position of this level, from LOW (0) to CRITICAL (3)."""
+        return _SEVERITY_RANK[self]
+
+    def __lt__(self, other):
+        rank = _severity_rank(other)
+        return NotImplemented if rank is None else _SEVERITY_RANK[self] < rank
+
+    def __le__(self, other):
+        rank = _severity_rank(other)
+        return NotImplemented if rank is None else _SEVERITY_RANK[self] <= rank
+
+    def __gt__(self, other):
+        rank = _severity_rank(other)
+        return NotImplemented if rank is None else _SEVERITY_RANK[self] > rank
+
+    def __ge__(self, other):
+        rank = _severity_rank(other)
+        return NotImplemented if rank is None else _SEVERITY_RANK[self] >= rank
+
+
+# Position of each level from LOW to CRITICAL
+_SEVERITY_RANK = {severity: rank for rank, severity in enumerate(SeverityEnum)}
+
+
+def _severity_rank(value: Any) -> Optional[int]:
+    """Rank of a severity member or raw value, None for anything else."""
+    try:
+        # Members hash like their values, so raw strings look up directly
+        return _SEVERITY_RANK.get(value)
+    except TypeError:  # unhashable operand
+        return None
+
 
 class ChangeType(str, Enum):
     """Types of changes that can be detected."""
@@ -37,7 +81,10 @@ class OutageReport(BaseModel):
     service_url: str = Field(..., description="URL to DownDetector page")
     status: StatusEnum = Field(..., description="Current status")
     report_count: int = Field(..., ge=0, description="Number of user reports")
-    timestamp: datetime = Field(..., description="Timestamp of the report")
+    timestamp: datetime = Field(
+        default_factory=datetime.now,
+        description="Timestamp of the report"
+    )
     severity: SeverityEnum = Field(..., description="Severity level")
     affected_regions: List[str] = Field(
         default_factory=list,
@@ -48,8 +95,12 @@ class OutageReport(BaseModel):
         description="Optional description of the outage"
     )
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=False,
+        extra="ignore",
+        validate_assignment=False,
+        use_enum_values=True,
+        json_schema_extra={
             "example": {
                 "service_name": "Google",
                 "service_url": "https://downdetector.com/status/google",
@@ -60,7 +111,27 @@ class OutageReport(BaseModel):
                 "affected_regions": ["US", "EU"],
                 "description": "Search and Gmail issues"
             }
-        }
+        },
+    )
+
+    @property
+    def severity_rank(self) -> int:
+        """Rank of the severity, for ordering reports (the field is a raw string)."""
+        return _SEVERITY_RANK[self.severity]
+
+
+class ChangeEventMsg(msgspec.Struct, frozen=True):
+    """Lightweight change event for the broadcast path (no validation)."""
+    change_type: str
+    service_name: str
+    old_status: Optional[str]
+    new_status: str
+    old_report_count: int
+    new_report_count: int
+    old_severity: Optional[str]
+    new_severity: str
+    timestamp: datetime
+    service_url: str
 
 
 class ChangeEvent(BaseModel):
@@ -87,25 +158,50 @@ class ChangeEvent(BaseModel):
         description="Previous severity"
     )
     new_severity: SeverityEnum = Field(..., description="Current severity")
-    timestamp: datetime = Field(..., description="Timestamp of the change")
+    timestamp: datetime = Field(
+        default_factory=datetime.now,
+        description="Timestamp of the change"
+    )
     service_url: str = Field(..., description="URL to DownDetector page")
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization."""
-        return {
-            "change_type": self.change_type.value,
-            "service_name": self.service_name,
-            "old_status": self.old_status.value if self.old_status else None,
-            "new_status": self.new_status.value,
-            "old_report_count": self.old_report_count,
-            "new_report_count": self.new_report_count,
-            "old_severity": self.old_severity.value if self.old_severity else None,
-            "new_severity": self.new_severity.value,
-            "timestamp": self.timestamp.isoformat(),
-            "service_url": self.service_url,
-        }
+    model_config = ConfigDict(
+        frozen=False,
+        extra="ignore",
+        validate_assignment=False,
+        use_enum_values=True,
+    )
+
+    @property
+    def old_severity_rank(self) -> Optional[int]:
+        """Rank of the previous severity, None when there was none."""
+        return None if self.old_severity is None else _SEVERITY_RANK[self.old_severity]
 
+    @property
+    def new_severity_rank(self) -> int:
+        """Rank of the current severity, for ordering changes."""
+        return _SEVERITY_RANK[self.new_severity]
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return self.model_dump(mode="json")
+
+    def to_msg(self) -> ChangeEventMsg:
+        """Convert to a msgspec struct for fast encoding."""
+        return ChangeEventMsg(
+            change_type=self.change_type,
+            service_name=self.service_name,
+            old_status=self.old_status,
+            new_status=self.new_status,
+            old_report_count=self.old_report_count,
+            new_report_count=self.new_report_count,
+            old_severity=self.old_severity,
+            new_severity=self.new_severity,
+            timestamp=self.timestamp,
+            service_url=self.service_url,
+        )
+
+
+# internal: construct via model_construct (fields come from trusted server state)
 class HealthCheckResponse(BaseModel):
     """Health check response model."""
     status: str = Field(..., description="Health status")
@@ -114,6 +210,7 @@ class HealthCheckResponse(BaseModel):
     uptime_seconds: int = Field(..., ge=0, description="Uptime in seconds")
 
 
+# internal: construct via model_construct (fields come from trusted server state)
 class StatusResponse(BaseModel):
     """Status response model."""
     services: List[OutageReport]
@@ -121,6 +218,7 @@ class StatusResponse(BaseModel):
     timestamp: datetime
 
 
+# changes are raw dicts from history, so this one is still validated
 class ChangesResponse(BaseModel):
     """Changes response model."""
     changes: List[ChangeEvent]
@@ -128,6 +226,7 @@ class ChangesResponse(BaseModel):
     time_range: Dict[str, str]
 
 
+# Documents the /metrics payload, which is encoded directly from SystemMetrics.to_dict()
 class MetricsResponse(BaseModel):
     """Metrics response model."""
     total_scrapes: int = Field(..., ge=0)
@@ -1,7 +1,22 @@
 """Notification services for email and WebSocket delivery."""
 
-from src.notifier.email_notifier import EmailNotifier
-from src.notifier.websocket_notifier import WebSocketNotifier
-from src.notifier.config import EmailConfig
+from importlib import import_module
 
-__all__ = ["EmailNotifier", "WebSocketNotifier", "EmailConfig"]
+from src.notifier.config import EmailConfig, WebSocketConfig
+
+__all__ = ["EmailNotifier", "WebSocketNotifier", "EmailConfig", "WebSocketConfig"]
+
+# Notifiers pull in aiosmtplib, jinja2 and socketio, so load them on first use
+_LAZY_IMPORTS = {
+    "EmailNotifier": "src.notifier.email_notifier",
+    "WebSocketNotifier": "src.notifier.websocket_notifier",
+}
+
+
+def __getattr__(name: str):
+    """Import notifier classes lazily (PEP 562)."""
+    if name in _LAZY_IMPORTS:
+        value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
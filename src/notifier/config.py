@@ -1,5 +1,6 @@
 """Configuration for notification services."""
 
+from functools import cached_property
 from pydantic_settings import BaseSettings
 from typing import List
 
@@ -14,8 +15,10 @@ class EmailConfig(BaseSettings):
     smtp_password: str = ""
     sender_email: str = "notifications@localhost"
     recipient_emails: str = ""
+    # Parallel SMTP sessions per notification (one per service, at most this many)
+    max_concurrent_sends: int = 5
 
-    @property
+    @cached_property
     def recipients_list(self) -> List[str]:
         """Get list of recipient emails."""
         if not self.recipient_emails:
@@ -24,3 +27,13 @@ class EmailConfig(BaseSettings):
 
     class Config:
         env_prefix = "EMAIL_"
+
+
+class WebSocketConfig(BaseSettings):
+    """WebSocket configuration."""
+
+    # Packet encoding: "json" (default) or "msgpack" (clients must use msgpack too)
+    serializer: str = "json"
+
+    class Config:
+        env_prefix = "WS_"
@@ -1,17 +1,77 @@
 """Email notification service."""
 
-import smtplib
+import asyncio
+import aiosmtplib
+from collections import defaultdict
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from typing import List, Optional
+from typing import Dict, List, Optional
 from pathlib import Path
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template
 
 from src.models import ChangeEvent
 from src.notifier.config import EmailConfig
 from src.utils.logger import get_logger
 
 
+# Subject lines per change type, formatted with the service name
+_SUBJECT_TEMPLATES = {
+    "new_outage": "[ALERT] {svc} is experiencing issues",
+    "status_changed": "[UPDATE] {svc} status changed",
+    "severity_increased": "[CRITICAL] {svc} outage severity increased",
+    "severity_decreased": "[INFO] {svc} outage severity decreased",
+    "report_count_spike": "[WARNING] {svc} reports spiking",
+    "outage_resolved": "[RESOLVED] {svc} issues resolved",
+}
+_DEFAULT_SUBJECT = "[UPDATE] {svc} Status Update"
+
+# Fallback HTML used when Jinja2 templates are not available
+_CHANGE_TMPL = """
+            <div style="margin: 15px 0; padding: 10px; border-left: 3px solid #f44336; background-color: #f9f9f9;">
+                <strong>{change_type}</strong>
+                <p>Status: {status}</p>
+                <p>Report Count: {report_count:,}</p>
+                <p>Severity: {severity}</p>
+                <p>Time: {time}</p>
+            </div>
+            """
+
+_ARTICLE_TMPL = """
+            <div style="margin: 20px 0; padding: 15px; background-color: #f0f0f0; border-radius: 5px;">
+                <h3>AI Summary</h3>
+                <p>{article}</p>
+            </div>
+            """
+
+_BASIC_HTML_TMPL = """
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <meta charset="UTF-8">
+        </head>
+        <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
+            <div style="background-color: #f44336; color: white; padding: 20px; text-align: center;">
+                <h1>Service Outage Alert</h1>
+                <p>{service_name}</p>
+            </div>
+
+            <div style="padding: 20px;">
+                <h2>Detected Changes</h2>
+                {changes_html}
+                {article_section}
+                <p>
+                    <a href="{service_url}">View on DownDetector</a>
+                </p>
+            </div>
+
+            <div style="padding: 20px; text-align: center; font-size: 0.9em; color: #666;">
+                <p>Powered by DownDetector Outage Monitor</p>
+                <p>This is an automated notification</p>
+            </div>
+        </body>
+        </html>
+        """
+
 class EmailNotifier:
     """Handles email notifications for outage changes."""
 
@@ -25,17 +85,40 @@ class EmailNotifier:
         self.config = config or EmailConfig()
         self.logger = get_logger("email_notifier")
 
+        # Headers shared by every message this notifier sends
+        self._msg_shell_headers = {
+            "From": self.config.sender_email,
+            "To": ", ".join(self.config.recipients_list),
+        }
+
         # Setup Jinja2 template environment
         template_dir = Path(__file__).parent.parent.parent / "templates"
         if template_dir.exists():
             self.template_env = Environment(
                 loader=FileSystemLoader(str(template_dir)),
-                autoescape=True
+                autoescape=True,
+                auto_reload=False,
+                bytecode_cache=FileSystemBytecodeCache()
             )
         else:
             self.template_env = None
             self.logger.warning(f"Template directory not found: {template_dir}")
 
+        # Resolve templates once so sends never touch the filesystem
+        self._tpl_ai = self._load_template("email_ai_article.html")
+        self._tpl_basic = self._load_template("email_basic.html")
+
+    def _load_template(self, name: str) -> Optional[Template]:
+        """Load a template, returning None if it is unavailable."""
+        if not self.template_env:
+            return None
+
+        try:
+            return self.template_env.get_template(name)
+        except Exception as e:
+            self.logger.warning(f"Failed to load template {name}: {e}")
+            return None
+
     async def send_change_notification(
         self,
         changes: List[ChangeEvent],
@@ -60,24 +143,60 @@ class EmailNotifier:
             return False
 
         # Group changes by service
-        changes_by_service = {}
+        changes_by_service: Dict[str, List[ChangeEvent]] = defaultdict(list)
         for change in changes:
-            service = change.service_name
-            if service not in changes_by_service:
-                changes_by_service[service] = []
-            changes_by_service[service].append(change)
+            changes_by_service[change.service_name].append(change)
 
-        # Send email for each service with changes
-        success = True
-        for service_name, service_changes in changes_by_service.items():
+        # Open a small pool of SMTP sessions; its size bounds concurrent sends
+        pool_size = min(self.config.max_concurrent_sends, len(changes_by_service))
+        pool: asyncio.Queue = asyncio.Queue()
+        for _ in range(max(pool_size, 1)):
             try:
+                pool.put_nowait(await self._connect())
+            except Exception as e:
+                self.logger.error(f"Failed to connect to SMTP server: {e}")
+                break
+
+        if pool.empty():
+            return False
+
+        async def send(service_name: str, service_changes: List[ChangeEvent]) -> None:
+            # None marks a slot whose session was dropped; reconnect on use
+            server = await pool.get()
+            try:
+                if server is None:
+                    server = await self._connect()
                 await self._send_service_notification(
                     service_name,
                     service_changes,
-                    article_content
+                    article_content,
+                    server
                 )
-            except Exception as e:
-                self.logger.error(f"Failed to send notification for {service_name}: {e}")
+            except Exception:
+                # The session may be broken; never hand it to the next send
+                if server is not None:
+                    server.close()
+                    server = None
+                raise
+            finally:
+                pool.put_nowait(server)
+
+        # Send email for each service with changes concurrently
+        try:
+            results = await asyncio.gather(
+                *(send(name, chs) for name, chs in changes_by_service.items()),
+                return_exceptions=True
+            )
+        finally:
+            while not pool.empty():
+                server = pool.get_nowait()
+                if server is not None:
+                    await self._disconnect(server)
+
+        success = True
+        for service_name, result in zip(changes_by_service, results):
+            if isinstance(result, Exception):
+                self.logger.error(f"Failed to send notification for {service_name}: {result}")
                 success = False
 
         return success
@@ -86,7 +205,8 @@ class EmailNotifier:
         self,
         service_name: str,
         changes: List[ChangeEvent],
-        article_content: Optional[str] = None
+        article_content: Optional[str] = None,
+        server: Optional[aiosmtplib.SMTP] = None
     ) -> None:
         """Send notification for a specific service."""
         primary_change = changes[0]
@@ -95,10 +215,9 @@ class EmailNotifier:
         subject = self._generate_subject(service_name, primary_change)
 
         # Generate HTML content
-        if self.template_env and article_content:
+        if self._tpl_ai and article_content:
             try:
-                template = self.template_env.get_template("email_ai_article.html")
-                html_content = template.render(
+                html_content = self._tpl_ai.render(
                     service_name=service_name,
                     article=article_content,
                     changes=changes,
@@ -106,10 +225,9 @@ class EmailNotifier:
                 )
             except Exception:
                 html_content = self._generate_basic_html(service_name, changes, article_content)
-        elif self.template_env:
+        elif self._tpl_basic and not article_content:
             try:
-                template = self.template_env.get_template("email_basic.html")
-                html_content = template.render(
+                html_content = self._tpl_basic.render(
                     service_name=service_name,
                     changes=changes,
                     primary_change=primary_change,
@@ -121,38 +239,59 @@ class EmailNotifier:
             html_content = self._generate_basic_html(service_name, changes, article_content)
 
         # Send email
-        await self._send_email(subject, html_content)
+        await self._send_email(subject, html_content, server)
         self.logger.info(f"Email sent for {service_name} to {len(self.config.recipients_list)} recipients")
 
-    async def _send_email(self, subject: str, html_content: str) -> None:
-        """Send actual email via SMTP."""
+    async def _connect(self) -> aiosmtplib.SMTP:
+        """Open an SMTP connection (with STARTTLS if enabled) and authenticate."""
+        server = aiosmtplib.SMTP(
+            hostname=self.config.smtp_host,
+            port=self.config.smtp_port,
+            start_tls=self.config.use_tls,
+            timeout=30,
+        )
+        await server.connect()
+        try:
+            if self.config.smtp_username and self.config.smtp_password:
+                await server.login(
+                    self.config.smtp_username,
+                    self.config.smtp_password
+                )
+        except Exception:
+            server.close()
+            raise
+
+        return server
+
+    async def _disconnect(self, server: aiosmtplib.SMTP) -> None:
+        """Close an SMTP connection, dropping it if QUIT fails."""
+        try:
+            await server.quit()
+        except Exception:
+            server.close()
+
+    async def _send_email(
+        self,
+        subject: str,
+        html_content: str,
+        server: Optional[aiosmtplib.SMTP] = None
+    ) -> None:
+        """Send actual email via SMTP, reusing an open connection if given."""
         message = MIMEMultipart("alternative")
-        message["From"] = self.config.sender_email
-        message["To"] = ", ".join(self.config.recipients_list)
+        for header, value in self._msg_shell_headers.items():
+            message[header] = value
         message["Subject"] = subject
-
-        html_part = MIMEText(html_content, "html")
-        message.attach(html_part)
+        message.attach(MIMEText(html_content, "html", "utf-8"))
 
         try:
-            with smtplib.SMTP(
-                self.config.smtp_host,
-                self.config.smtp_port,
-                timeout=30
-            ) as server:
-                if self.config.use_tls:
-                    server.starttls()
-
-                if self.config.smtp_username and self.config.smtp_password:
-                    server.login(
-                        self.config.smtp_username,
-                        self.config.smtp_password
-                    )
-
-                server.send_message(message)
-                self.logger.debug("Email sent successfully via SMTP")
-
-        except smtplib.SMTPException as e:
+            if server is not None:
+                await server.send_message(message)
+            else:
+                async with await self._connect() as own_server:
+                    await own_server.send_message(message)
+            self.logger.debug("Email sent successfully via SMTP")
+
+        except aiosmtplib.SMTPException as e:
             self.logger.error(f"SMTP error: {e}")
             raise
         except Exception as e:
@@ -161,19 +300,8 @@ class EmailNotifier:
 
     def _generate_subject(self, service_name: str, change: ChangeEvent) -> str:
         """Generate email subject line."""
-        change_type_messages = {
-            "new_outage": f"[ALERT] {service_name} is experiencing issues",
-            "status_changed": f"[UPDATE] {service_name} status changed",
-            "severity_increased": f"[CRITICAL] {service_name} outage severity increased",
-            "severity_decreased": f"[INFO] {service_name} outage severity decreased",
-            "report_count_spike": f"[WARNING] {service_name} reports spiking",
-            "outage_resolved": f"[RESOLVED] {service_name} issues resolved",
-        }
-
-        return change_type_messages.get(
-            change.change_type.value,
-            f"[UPDATE] {service_name} Status Update"
-        )
+        template = _SUBJECT_TEMPLATES.get(change.change_type, _DEFAULT_SUBJECT)
+        return template.format(svc=service_name)
 
     def _generate_basic_html(
         self,
@@ -182,52 +310,23 @@ class EmailNotifier:
         article_content: Optional[str] = None
     ) -> str:
         """Generate basic HTML email when templates are not available."""
-        changes_html = ""
+        parts: List[str] = []
         for change in changes:
-            changes_html += f"""
-            <div style="margin: 15px 0; padding: 10px; border-left: 3px solid #f44336; background-color: #f9f9f9;">
-                <strong>{change.change_type.value.replace('_', ' ').title()}</strong>
-                <p>Status: {change.new_status.value}</p>
-                <p>Report Count: {change.new_report_count:,}</p>
-                <p>Severity: {change.new_severity.value}</p>
-                <p>Time: {change.timestamp.strftime('%Y-%m-%d %H:%M:%S UTC')}</p>
-            </div>
-            """
+            parts.append(_CHANGE_TMPL.format(
+                change_type=change.change_type.replace('_', ' ').title(),
+                status=change.new_status,
+                report_count=change.new_report_count,
+                severity=change.new_severity,
+                time=change.timestamp.strftime('%Y-%m-%d %H:%M:%S UTC'),
+            ))
 
         article_section = ""
         if article_content:
-            article_section = f"""
-            <div style="margin: 20px 0; padding: 15px; background-color: #f0f0f0; border-radius: 5px;">
-                <h3>AI Summary</h3>
-                <p>{article_content}</p>
-            </div>
-            """
+            article_section = _ARTICLE_TMPL.format(article=article_content)
 
-        return f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="UTF-8">
-        </head>
-        <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
-            <div style="background-color: #f44336; color: white; padding: 20px; text-align: center;">
-                <h1>Service Outage Alert</h1>
-                <p>{service_name}</p>
-            </div>
-
-            <div style="padding: 20px;">
-                <h2>Detected Changes</h2>
-                {changes_html}
-                {article_section}
-                <p>
-                    <a href="{changes[0].service_url}">View on DownDetector</a>
-                </p>
-            </div>
-
-            <div style="padding: 20px; text-align: center; font-size: 0.9em; color: #666;">
-                <p>Powered by DownDetector Outage Monitor</p>
-                <p>This is an automated notification</p>
-            </div>
-        </body>
-        </html>
-        """
+        return _BASIC_HTML_TMPL.format(
+            service_name=service_name,
+            changes_html="".join(parts),
+            article_section=article_section,
+            service_url=changes[0].service_url,
+        )
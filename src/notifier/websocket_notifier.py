@@ -1,25 +1,52 @@
 """WebSocket notification service for real-time updates."""
 
-from typing import List, Set, Optional
+from typing import Any, List, Optional
+import msgspec
 import socketio
 
 from src.models import ChangeEvent
+from src.notifier.config import WebSocketConfig
 from src.utils.logger import get_logger
 
 
+class _MsgspecJSON:
+    """json-module shim so python-socketio encodes packets with msgspec."""
+
+    @staticmethod
+    def dumps(obj: Any, **kwargs) -> str:
+        return msgspec.json.encode(obj).decode()
+
+    @staticmethod
+    def loads(data, **kwargs) -> Any:
+        return msgspec.json.decode(data)
+
+
 class WebSocketNotifier:
     """Handles WebSocket notifications for real-time updates."""
 
-    def __init__(self):
-        """Initialize WebSocket notifier."""
+    def __init__(self, config: Optional[WebSocketConfig] = None):
+        """
+        Initialize WebSocket notifier.
+
+        Args:
+            config: WebSocket configuration object
+        """
+        self.config = config or WebSocketConfig()
         self.logger = get_logger("websocket_notifier")
+
+        # Binary msgpack packets are smaller and cheaper to encode; JSON stays the default
+        if self.config.serializer == "msgpack":
+            serializer_options = {"serializer": "msgpack"}
+        else:
+            serializer_options = {"json": _MsgspecJSON}
+
         self.sio = socketio.AsyncServer(
             async_mode="asgi",
             cors_allowed_origins="*",
             logger=False,
             engineio_logger=False,
+            **serializer_options,
         )
-        self.connected_clients: Set[str] = set()
 
         # Register event handlers
         self.sio.on("connect", self._handle_connect)
@@ -28,13 +55,11 @@ class WebSocketNotifier:
 
     async def _handle_connect(self, sid: str, environ: dict) -> None:
         """Handle client connection."""
-        self.connected_clients.add(sid)
         self.logger.info(f"Client connected: {sid}")
         await self.sio.emit("connection_established", {"sid": sid}, room=sid)
 
     async def _handle_disconnect(self, sid: str) -> None:
         """Handle client disconnection."""
-        self.connected_clients.discard(sid)
         self.logger.info(f"Client disconnected: {sid}")
 
     async def _handle_subscribe(self, sid: str, data: dict) -> None:
@@ -53,20 +78,26 @@ class WebSocketNotifier:
         if not changes:
             return
 
-        if not self.connected_clients:
+        client_count = self.get_connected_count()
+        if not client_count:
             self.logger.debug("No connected clients to broadcast to")
             return
 
-        # Convert changes to dict format
-        change_data = [change.to_dict() for change in changes]
-
         # Broadcast to all connected clients
-        await self.sio.emit("outage_update", {
-            "changes": change_data,
-            "count": len(changes),
-        })
+        await self.sio.emit("outage_update", self._build_payload(changes))
+
+        self.logger.info(f"Broadcast {len(changes)} changes to {client_count} clients")
 
-        self.logger.info(f"Broadcast {len(changes)} changes to {len(self.connected_clients)} clients")
+    def _build_payload(self, changes: List[ChangeEvent]) -> dict:
+        """Build the broadcast payload for a list of changes."""
+        payload = {
+            "changes": [change.to_msg() for change in changes],
+            "count": len(changes),
+        }
+        # The msgpack packet encoder only understands builtin types
+        if self.config.serializer == "msgpack":
+            payload = msgspec.to_builtins(payload)
+        return payload
 
     async def send_to_client(self, sid: str, event: str, data: dict) -> None:
         """
@@ -77,7 +108,7 @@ class WebSocketNotifier:
             event: Event name
             data: Event data
         """
-        if sid in self.connected_clients:
+        if self.sio.manager.is_connected(sid, "/"):
             await self.sio.emit(event, data, room=sid)
 
     def get_asgi_app(self) -> socketio.ASGIApp:
@@ -86,11 +117,12 @@ class WebSocketNotifier:
 
     def get_connected_count(self) -> int:
         """Get number of connected clients."""
-        return len(self.connected_clients)
+        # Every client joins the namespace-wide room (None) on connect
+        return len(self.sio.manager.rooms.get("/", {}).get(None, {}))
 
     async def close(self) -> None:
         """Close all connections."""
-        for sid in list(self.connected_clients):
+        sids = [sid for sid, _ in self.sio.manager.get_participants("/", None)]
+        for sid in sids:
             await self.sio.disconnect(sid)
-        self.connected_clients.clear()
         self.logger.info("WebSocket notifier closed")
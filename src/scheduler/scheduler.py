@@ -37,10 +37,15 @@ class OutageMonitorScheduler:
         """
         self.logger = get_logger("scheduler")
 
+        # Build each config once (pydantic-settings parses the environment per instance)
+        scraper_config = scraper_config or ScraperConfig()
+        detector_config = detector_config or DetectorConfig()
+        email_config = email_config or EmailConfig()
+
         # Initialize components
-        self.scraper = DownDetectorScraper(scraper_config or ScraperConfig())
-        self.detector = ChangeDetector(detector_config or DetectorConfig())
-        self.email_notifier = EmailNotifier(email_config or EmailConfig())
+        self.scraper = DownDetectorScraper(scraper_config)
+        self.detector = ChangeDetector(detector_config)
+        self.email_notifier = EmailNotifier(email_config)
         self.ws_notifier = WebSocketNotifier()
 
         # AI generator (optional)
@@ -51,7 +56,7 @@ class OutageMonitorScheduler:
         # Scheduler
         self.scheduler = AsyncIOScheduler()
         self.is_running = False
-        self.interval_minutes = (scraper_config or ScraperConfig()).scrape_interval_minutes
+        self.interval_minutes = scraper_config.scrape_interval_minutes
 
     def start(self) -> None:
         """Start the scheduler."""
@@ -65,6 +70,10 @@ class OutageMonitorScheduler:
             trigger=IntervalTrigger(minutes=self.interval_minutes),
             id="outage_monitor",
             name="Outage Monitoring Job",
+            # A slow cycle delays the next tick instead of stacking runs
+            max_instances=1,
+            coalesce=True,
+            misfire_grace_time=60,
             replace_existing=True,
         )
 
@@ -101,7 +110,7 @@ class OutageMonitorScheduler:
                 return
 
             # Count current outages
-            outages = sum(1 for r in reports if r.status.value != "up")
+            outages = sum(1 for r in reports if r.status != "up")
             metrics.update_outages_count(outages)
 
             # Step 2: Detect changes
@@ -120,14 +129,23 @@ class OutageMonitorScheduler:
                     self.logger.info("AI article generated successfully")
 
             # Step 4: Send notifications
-            # Email notifications
-            await self.email_notifier.send_change_notification(changes, article)
-            metrics.increment_notifications(len(changes))
-            self.logger.info("Email notifications sent")
-
-            # WebSocket notifications
-            await self.ws_notifier.broadcast_changes(changes)
-            self.logger.info("WebSocket notifications sent")
+            # Email and WebSocket delivery are independent, so run them together
+            email_result, ws_result = await asyncio.gather(
+                self.email_notifier.send_change_notification(changes, article),
+                self.ws_notifier.broadcast_changes(changes),
+                return_exceptions=True,
+            )
+
+            if isinstance(email_result, Exception):
+                self.logger.error(f"Email notifications failed: {email_result}")
+            else:
+                metrics.increment_notifications(len(changes))
+                self.logger.info("Email notifications sent")
+
+            if isinstance(ws_result, Exception):
+                self.logger.error(f"WebSocket notifications failed: {ws_result}")
+            else:
+                self.logger.info("WebSocket notifications sent")
 
             self.logger.info(f"[{datetime.now()}] Monitoring cycle completed successfully")
 
@@ -152,7 +170,7 @@ class OutageMonitorScheduler:
                 "success": True,
                 "reports_count": len(reports),
                 "changes_count": len(changes),
-                "changes": [c.to_dict() for c in changes],
+                "changes": [c.model_dump(mode="json") for c in changes],
             }
         except Exception as e:
             self.logger.error(f"Manual cycle failed: {e}")
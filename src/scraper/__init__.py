@@ -1,6 +1,21 @@
 """Scraper module for DownDetector data extraction."""
 
-from src.scraper.downdetector_scraper import DownDetectorScraper
+from importlib import import_module
+
 from src.scraper.config import ScraperConfig
 
 __all__ = ["DownDetectorScraper", "ScraperConfig"]
+
+# The scraper pulls in httpx and the HTML parser, so load it on first use
+_LAZY_IMPORTS = {
+    "DownDetectorScraper": "src.scraper.downdetector_scraper",
+}
+
+
+def __getattr__(name: str):
+    """Import scraper classes lazily (PEP 562)."""
+    if name in _LAZY_IMPORTS:
+        value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
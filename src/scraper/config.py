@@ -1,15 +1,40 @@
-# ...
+"""Configuration for scraper service."""
+
+from functools import cached_property
 from pydantic_settings import BaseSettings
-from typing import List, Optional # Adicione Optional se não estiver
+from typing import Optional, Tuple
+
 
 class ScraperConfig(BaseSettings):
-    # ... (outras configurações)
+    """Scraper configuration."""
+
+    scrape_interval_minutes: int = 10
+    timeout_seconds: int = 30
+    retry_attempts: int = 3
+    retry_delay_seconds: int = 5
+    # Services scraped in parallel per cycle
+    max_concurrency: int = 16
+    # Multiplex requests over one connection (needs the h2 package)
+    http2: bool = True
+    # Keep-alive pool shared by every scrape
+    max_connections: int = 100
+    max_keepalive: int = 64
+    # How long a service whose page returned 404 is skipped
+    not_found_ttl_seconds: int = 3600
+    # Reuse a parsed page for this long without any request; kept well under
+    # the scrape interval so scheduled runs still revalidate every cycle
+    page_cache_ttl_seconds: int = 60
     user_agent: str = "Mozilla/5.0 (compatible; OutageBot/1.0)"
     monitored_services: str = "google,facebook,twitter,instagram,whatsapp"
-    
-    # --- Configurações do Crawl4AI ---
+
+    # Crawl4AI settings
     CRAWL4AI_API_KEY: Optional[str] = None
-    CRAWL4AI_ENDPOINT: str = "https://api.crawl4ai.com/v1" 
-    
-    @property
-# ...
+    CRAWL4AI_ENDPOINT: str = "https://api.crawl4ai.com/v1"
+
+    @cached_property
+    def services_list(self) -> Tuple[str, ...]:
+        """Get the monitored services, parsed once per config."""
+        return tuple(s.strip() for s in self.monitored_services.split(",") if s.strip())
+
+    class Config:
+        env_prefix = "SCRAPER_"
@@ -1,21 +1,168 @@
 """DownDetector web scraper for outage information."""
 
-from typing import List, Optional
+from bisect import bisect_left
 from datetime import datetime
+from typing import Dict, List, Optional, Tuple
 import asyncio
+import re
+import time
 import httpx
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborCSSSelector, LexborHTMLParser, LexborNode
 
 from src.models import OutageReport, StatusEnum, SeverityEnum
 from src.scraper.config import ScraperConfig
 from src.utils.logger import get_logger
 
+try:
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+
+_REPORT_COUNT_RE = re.compile(r"(\d+(?:,\d+)*)\s*(?:report|user)", re.IGNORECASE)
+_NON_DIGITS_RE = re.compile(r"\D+")
+# Status keywords in one pass; the leftmost match wins, so "possible problems"
+# reads as issues and "no problems" as up
+_STATUS_RE = re.compile(
+    r"(?P<up>\bno problems?\b)"
+    r"|(?P<down>\bdown\b|major|problem|issue|outage)"
+    r"|(?P<issues>possible|warning)",
+    re.IGNORECASE,
+)
+_UP, _ISSUES, _DOWN = StatusEnum.UP, StatusEnum.ISSUES, StatusEnum.DOWN
+_STATUS_BY_GROUP = {
+    "up": _UP,
+    "down": _DOWN,
+    "issues": _ISSUES,
+}
+
+# Report-count thresholds and the severity for each band between them
+_SEVERITY_THRESHOLDS = (1000, 5000, 10000)
+_SEVERITY_LEVELS = (
+    SeverityEnum.LOW,
+    SeverityEnum.MEDIUM,
+    SeverityEnum.HIGH,
+    SeverityEnum.CRITICAL,
+)
+
+# Selector groups, each matched in a single tree walk (results in document order).
+# These selectors are based on typical DownDetector page structure.
+_STATUS_SELECTOR = ".entry-title, .status-title, h1, .company-status"
+_COUNT_SELECTOR = ".reports-count, .report-count, .count, [data-reports]"
+_REGION_SELECTOR = ".affected-region, .region, .location-item, .city-item"
+_DESCRIPTION_SELECTOR = ".entry-content p, .description, .summary"
+# Elements whose text is code, not page content
+_NON_TEXT_TAGS = frozenset({"script", "style", "template"})
+
+# One selector engine reused for every query instead of one allocated per tree.css() call
+_SELECTOR_ENGINE = LexborCSSSelector()
+
+
+def _select(tree: LexborHTMLParser, query: str) -> List[LexborNode]:
+    """Match a body selector group with the shared engine, skipping <head>."""
+    return _SELECTOR_ENGINE.find(query, tree.body or tree.root)
+
+
+def _visible_text(tree: LexborHTMLParser) -> str:
+    """Join the body's text nodes, skipping script and style contents."""
+    root = tree.body or tree.root
+    return " ".join(
+        node.text_content
+        for node in root.traverse(include_text=True)
+        if node.is_text_node and node.parent.tag not in _NON_TEXT_TAGS
+    )
+
+
+def _parse_status(text: str) -> StatusEnum:
+    """
+    Classify a status label by its keywords.
+
+    Args:
+        text: Status text from the page
+
+    Returns:
+        Status for the first keyword found, UP if there is none
+    """
+    match = _STATUS_RE.search(text)
+    if not match:
+        return _UP
+    return _STATUS_BY_GROUP[match.lastgroup]
+
+
+def _calculate_severity(report_count: int) -> SeverityEnum:
+    """
+    Calculate severity level based on report count.
+
+    Args:
+        report_count: Number of user reports
+
+    Returns:
+        Severity level
+    """
+    # Thresholds are exclusive: a count must exceed one to reach the next level
+    return _SEVERITY_LEVELS[bisect_left(_SEVERITY_THRESHOLDS, report_count)]
+
+
+# Client shared by every scraper so connections and TLS sessions outlive a single instance
+_SHARED_CLIENT: Optional[httpx.AsyncClient] = None
+
+
+async def get_shared_client(config: ScraperConfig) -> httpx.AsyncClient:
+    """
+    Get the process-wide HTTP client, creating it on first use.
+
+    Args:
+        config: Scraper configuration used when the client is created
+
+    Returns:
+        Shared HTTP client
+    """
+    global _SHARED_CLIENT
+    if _SHARED_CLIENT is None or _SHARED_CLIENT.is_closed:
+        # Accept-Encoding is left to httpx: it advertises and decodes br when
+        # brotli is installed, and never offers an encoding it cannot decode
+        _SHARED_CLIENT = httpx.AsyncClient(
+            timeout=config.timeout_seconds,
+            headers={
+                "User-Agent": config.user_agent,
+                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+                "Accept-Language": "en-US,en;q=0.5",
+            },
+            follow_redirects=True,
+            http2=config.http2 and _HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=config.max_connections,
+                max_keepalive_connections=config.max_keepalive,
+            ),
+        )
+    return _SHARED_CLIENT
+
+
+async def shutdown_shared_client() -> None:
+    """Close the process-wide HTTP client (call on application shutdown)."""
+    global _SHARED_CLIENT
+    if _SHARED_CLIENT is not None:
+        await _SHARED_CLIENT.aclose()
+        _SHARED_CLIENT = None
+
 
 class DownDetectorScraper:
     """Scraper for DownDetector.com outage information."""
 
     BASE_URL = "https://downdetector.com"
 
+    __slots__ = (
+        "config",
+        "logger",
+        "client",
+        "_semaphore",
+        "_validators",
+        "_cached_reports",
+        "_negative_cache",
+        "_inflight",
+    )
+
     def __init__(self, config: Optional[ScraperConfig] = None):
         """
         Initialize DownDetector scraper.
@@ -26,19 +173,23 @@ class DownDetectorScraper:
         self.config = config or ScraperConfig()
         self.logger = get_logger("scraper")
         self.client: Optional[httpx.AsyncClient] = None
+        self._semaphore = asyncio.Semaphore(self.config.max_concurrency)
+
+        # Conditional request headers, per URL
+        self._validators: Dict[str, Dict[str, str]] = {}
+        # Last parsed report per page URL with the monotonic time it was fetched
+        self._cached_reports: Dict[str, Tuple[float, OutageReport]] = {}
+
+        # Services whose page returned 404, mapped to a monotonic expiry time
+        self._negative_cache: Dict[str, float] = {}
+
+        # Page requests currently running, per URL, awaited by concurrent callers
+        self._inflight: Dict[str, asyncio.Future] = {}
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client."""
+        """Get the HTTP client, attaching to the shared one on first use."""
         if self.client is None:
-            self.client = httpx.AsyncClient(
-                timeout=self.config.timeout_seconds,
-                headers={
-                    "User-Agent": self.config.user_agent,
-                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                    "Accept-Language": "en-US,en;q=0.5",
-                },
-                follow_redirects=True,
-            )
+            self.client = await get_shared_client(self.config)
         return self.client
 
     async def scrape_all_services(self) -> List[OutageReport]:
@@ -48,19 +199,28 @@ class DownDetectorScraper:
         Returns:
             List of OutageReport objects
         """
-        reports = []
         services = self.config.services_list
 
         self.logger.info(f"Starting scrape for {len(services)} services")
 
-        for service in services:
+        results = await asyncio.gather(
+            *(self._scrape_with_retry(service) for service in services),
+            return_exceptions=True,
+        )
+        reports = [r for r in results if isinstance(r, OutageReport)]
+
+        self.logger.info(f"Scraping complete. Retrieved {len(reports)} reports")
+        return reports
+
+    async def _scrape_with_retry(self, service: str) -> Optional[OutageReport]:
+        """Scrape one service, retrying on errors, within the concurrency limit."""
+        async with self._semaphore:
             for attempt in range(self.config.retry_attempts):
                 try:
                     report = await self.scrape_service(service)
                     if report:
-                        reports.append(report)
                         self.logger.debug(f"Successfully scraped {service}")
-                    break
+                    return report
                 except Exception as e:
                     if attempt < self.config.retry_attempts - 1:
                         self.logger.warning(
@@ -71,9 +231,7 @@ class DownDetectorScraper:
                         self.logger.error(
                             f"Failed to scrape {service} after {self.config.retry_attempts} attempts: {e}"
                         )
-
-        self.logger.info(f"Scraping complete. Retrieved {len(reports)} reports")
-        return reports
+        return None
 
     async def scrape_service(self, service_name: str) -> Optional[OutageReport]:
         """
@@ -85,26 +243,103 @@ class DownDetectorScraper:
         Returns:
             OutageReport or None if scraping fails
         """
-        client = await self._get_client()
+        # Skip services known to be missing until their entry expires
+        if self._negative_cache.get(service_name, 0) > time.monotonic():
+            return None
+
         service_url = f"{self.BASE_URL}/status/{service_name}"
 
+        # Fetched recently enough; serve the parsed report without a request
+        cached = self._cached_reports.get(service_url)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < self.config.page_cache_ttl_seconds:
+            return cached[1].model_copy(update={"timestamp": datetime.now()})
+
+        # Concurrent scrapes of one page share a single request
+        inflight = self._inflight.get(service_url)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._fetch_service(service_name, service_url))
+            self._inflight[service_url] = inflight
+            inflight.add_done_callback(lambda _: self._inflight.pop(service_url, None))
+        return await asyncio.shield(inflight)
+
+    async def _fetch_service(
+        self,
+        service_name: str,
+        service_url: str
+    ) -> Optional[OutageReport]:
+        """
+        Request a service page, revalidating any cached report.
+
+        Args:
+            service_name: Name of the service to scrape
+            service_url: Status page URL for the service
+
+        Returns:
+            OutageReport or None if scraping fails
+        """
+        cached = self._cached_reports.get(service_url)
+        now = time.monotonic()
+        client = await self._get_client()
+
         try:
-            response = await client.get(service_url)
+            response = await client.get(
+                service_url,
+                headers=self._validators.get(service_url),
+            )
+
+            # Page unchanged since last scrape; reuse the parsed report
+            if response.status_code == 304 and cached is not None:
+                self.logger.debug(f"{service_name} not modified, reusing last report")
+                self._cached_reports[service_url] = (now, cached[1])
+                return cached[1].model_copy(update={"timestamp": datetime.now()})
+
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.text, "lxml")
-            return self._parse_service_page(soup, service_name, service_url)
+            # Hand raw bytes to the parser; it decodes them natively
+            tree = LexborHTMLParser(response.content)
+            report = self._parse_service_page(tree, service_name, service_url)
+            if report:
+                self._cached_reports[service_url] = (now, report)
+                self._remember_validators(service_url, response)
+            return report
 
         except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                self._negative_cache[service_name] = (
+                    time.monotonic() + self.config.not_found_ttl_seconds
+                )
+                self.logger.warning(
+                    f"Service page not found for {service_name}, "
+                    f"skipping it for {self.config.not_found_ttl_seconds}s"
+                )
+                return None
             self.logger.error(f"HTTP error for {service_name}: {e.response.status_code}")
             return None
         except httpx.RequestError as e:
             self.logger.error(f"Request error for {service_name}: {e}")
             return None
 
+    def _remember_validators(
+        self,
+        service_url: str,
+        response: httpx.Response
+    ) -> None:
+        """Store ETag/Last-Modified so the next request can be conditional."""
+        validators = {}
+        if etag := response.headers.get("ETag"):
+            validators["If-None-Match"] = etag
+        if last_modified := response.headers.get("Last-Modified"):
+            validators["If-Modified-Since"] = last_modified
+
+        if validators:
+            self._validators[service_url] = validators
+        else:
+            self._validators.pop(service_url, None)
+
     def _parse_service_page(
         self,
-        soup: BeautifulSoup,
+        tree: LexborHTMLParser,
         service_name: str,
         service_url: str
     ) -> Optional[OutageReport]:
@@ -112,7 +347,7 @@ class DownDetectorScraper:
         Parse the service page HTML to extract outage information.
 
         Args:
-            soup: BeautifulSoup object of the page
+            tree: Parsed HTML tree of the page
             service_name: Name of the service
             service_url: URL of the service page
 
@@ -121,26 +356,25 @@ class DownDetectorScraper:
         """
         try:
             # Extract status indicator
-            status = self._extract_status(soup)
+            status = self._extract_status(tree)
 
             # Extract report count
-            report_count = self._extract_report_count(soup)
+            report_count = self._extract_report_count(tree)
 
             # Extract affected regions (if available)
-            affected_regions = self._extract_regions(soup)
+            affected_regions = self._extract_regions(tree)
 
             # Extract description
-            description = self._extract_description(soup)
+            description = self._extract_description(tree)
 
             # Calculate severity based on report count
-            severity = self._calculate_severity(report_count)
+            severity = _calculate_severity(report_count)
 
             return OutageReport(
                 service_name=service_name.title(),
                 service_url=service_url,
                 status=status,
                 report_count=report_count,
-                timestamp=datetime.now(),
                 severity=severity,
                 affected_regions=affected_regions,
                 description=description,
@@ -150,131 +384,88 @@ class DownDetectorScraper:
             self.logger.error(f"Error parsing page for {service_name}: {e}")
             return None
 
-    def _extract_status(self, soup: BeautifulSoup) -> StatusEnum:
+    def _extract_status(self, tree: LexborHTMLParser) -> StatusEnum:
         """Extract service status from page."""
         # Try to find status indicator elements
-        # These selectors are based on typical DownDetector page structure
-        status_selectors = [
-            ".entry-title",
-            ".status-title",
-            "h1",
-            ".company-status",
-        ]
-
-        for selector in status_selectors:
-            element = soup.select_one(selector)
-            if element:
-                text = element.get_text().lower()
-                if "problem" in text or "issue" in text or "outage" in text:
-                    return StatusEnum.DOWN
-                elif "possible" in text or "warning" in text:
-                    return StatusEnum.ISSUES
+        for element in _select(tree, _STATUS_SELECTOR):
+            status = _parse_status(element.text(separator=" ", strip=True))
+            if status is not _UP:
+                return status
 
         # Check for report chart or baseline
-        chart = soup.select_one(".chart-container")
+        chart = tree.css_first(".chart-container")
         if chart:
             # If there's significant chart activity, there might be issues
-            return StatusEnum.ISSUES
+            return _ISSUES
 
-        return StatusEnum.UP
+        return _UP
 
-    def _extract_report_count(self, soup: BeautifulSoup) -> int:
+    def _extract_report_count(self, tree: LexborHTMLParser) -> int:
         """Extract number of user reports."""
-        # Try various selectors for report count
-        count_selectors = [
-            ".reports-count",
-            ".report-count",
-            ".count",
-            "[data-reports]",
-        ]
-
-        for selector in count_selectors:
-            element = soup.select_one(selector)
-            if element:
-                try:
-                    text = element.get_text().strip()
-                    # Extract numbers from text
-                    numbers = "".join(c for c in text if c.isdigit())
-                    if numbers:
-                        return int(numbers)
-                except ValueError:
-                    continue
+        # Try the report count elements
+        for element in _select(tree, _COUNT_SELECTOR):
+            try:
+                text = element.text(strip=True)
+                # Extract numbers from text
+                numbers = _NON_DIGITS_RE.sub("", text)
+                if numbers:
+                    return int(numbers)
+            except ValueError:
+                continue
 
         # Try to find any element with numbers that might be report count
-        # Look for patterns like "X reports"
-        import re
-        text = soup.get_text()
-        match = re.search(r"(\d+(?:,\d+)*)\s*(?:report|user)", text, re.IGNORECASE)
+        # Look for patterns like "X reports" in the visible page text
+        match = _REPORT_COUNT_RE.search(_visible_text(tree))
         if match:
             return int(match.group(1).replace(",", ""))
 
         return 0
 
-    def _extract_regions(self, soup: BeautifulSoup) -> List[str]:
+    def _extract_regions(self, tree: LexborHTMLParser) -> List[str]:
         """Extract affected regions from page."""
         regions = []
+        seen = set()
 
         # Look for region/location elements
-        region_selectors = [
-            ".affected-region",
-            ".region",
-            ".location-item",
-            ".city-item",
-        ]
-
-        for selector in region_selectors:
-            elements = soup.select(selector)
-            for element in elements:
-                region = element.get_text().strip()
-                if region and region not in regions:
-                    regions.append(region)
-
-        return regions[:10]  # Limit to 10 regions
-
-    def _extract_description(self, soup: BeautifulSoup) -> Optional[str]:
-        """Extract description or summary of the outage."""
-        desc_selectors = [
-            ".entry-content p",
-            ".description",
-            ".summary",
-            "meta[name='description']",
-        ]
-
-        for selector in desc_selectors:
-            element = soup.select_one(selector)
-            if element:
-                if element.name == "meta":
-                    return element.get("content", "")[:500]
-                text = element.get_text().strip()
-                if text and len(text) > 20:
-                    return text[:500]
+        for element in _select(tree, _REGION_SELECTOR):
+            region = element.text(separator=" ", strip=True)
+            if region and region not in seen:
+                seen.add(region)
+                regions.append(region)
+                if len(regions) == 10:  # Limit to 10 regions
+                    break
 
-        return None
+        return regions
 
-    def _calculate_severity(self, report_count: int) -> SeverityEnum:
-        """
-        Calculate severity level based on report count.
+    def _extract_description(self, tree: LexborHTMLParser) -> Optional[str]:
+        """Extract description or summary of the outage."""
+        for element in _select(tree, _DESCRIPTION_SELECTOR):
+            text = element.text(separator=" ", strip=True)
+            if text and len(text) > 20:
+                return text[:500]
 
-        Args:
-            report_count: Number of user reports
+        # The meta description lives in <head>, so only use it as a fallback
+        meta = tree.css_first("meta[name='description']")
+        if meta:
+            return (meta.attributes.get("content") or "")[:500]
 
-        Returns:
-            Severity level
-        """
-        if report_count > 10000:
-            return SeverityEnum.CRITICAL
-        elif report_count > 5000:
-            return SeverityEnum.HIGH
-        elif report_count > 1000:
-            return SeverityEnum.MEDIUM
-        return SeverityEnum.LOW
+        return None
+
+    # Pure helpers kept reachable on the class for existing callers
+    _parse_status = staticmethod(_parse_status)
+    _calculate_severity = staticmethod(_calculate_severity)
 
     async def close(self) -> None:
-        """Close the HTTP client."""
+        """Release the HTTP client; the shared client stays open for reuse."""
         if self.client:
-            await self.client.aclose()
+            if self.client is not _SHARED_CLIENT:
+                await self.client.aclose()
+                self.logger.debug("HTTP client closed")
             self.client = None
-            self.logger.debug("HTTP client closed")
+
+    async def aclose(self) -> None:
+        """Alias of close() matching the httpx client API."""
+        await self.close()
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -1,10 +1,56 @@
 """Logging configuration for the outage monitoring system."""
 
+import atexit
 import logging
 import sys
 import os
-from logging.handlers import RotatingFileHandler
-from typing import Optional
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from queue import SimpleQueue
+from typing import Dict, Optional
+
+# Records never use thread/process names; skip collecting them
+logging.logThreads = False
+logging.logProcesses = False
+
+# One queue per log file, drained by a single listener thread and file handler
+_FILE_QUEUES: Dict[str, SimpleQueue] = {}
+
+
+def _get_file_queue(log_file: str, formatter: logging.Formatter) -> SimpleQueue:
+    """
+    Get the queue feeding a log file, starting its writer on first use.
+
+    Args:
+        log_file: Path to log file
+        formatter: Formatter for the file handler
+
+    Returns:
+        Queue whose records are written to log_file
+    """
+    path = os.path.abspath(log_file)
+    log_queue = _FILE_QUEUES.get(path)
+    if log_queue is not None:
+        return log_queue
+
+    # Create log directory if it doesn't exist
+    log_dir = os.path.dirname(path)
+    os.makedirs(log_dir, exist_ok=True)
+
+    file_handler = RotatingFileHandler(
+        path,
+        maxBytes=10485760,  # 10MB
+        backupCount=5
+    )
+    file_handler.setFormatter(formatter)
+
+    # Write to the file from a background thread so logging never blocks the event loop
+    log_queue = SimpleQueue()
+    listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    _FILE_QUEUES[path] = log_queue
+    return log_queue
 
 
 def setup_logger(
@@ -24,7 +70,9 @@ def setup_logger(
         Configured logger instance
     """
     formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+        "{asctime} - {name} - {levelname} - {message}",
+        style="{",
+        datefmt="%Y-%m-%dT%H:%M:%S",
     )
 
     logger = logging.getLogger(name)
@@ -34,25 +82,16 @@ def setup_logger(
     if logger.handlers:
         return logger
 
+    logger.propagate = False
+
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
     logger.addHandler(console_handler)
 
-    # File handler (if log file specified)
+    # File handler (if log file specified), shared by every logger writing to the file
     if log_file:
-        # Create log directory if it doesn't exist
-        log_dir = os.path.dirname(log_file)
-        if log_dir and not os.path.exists(log_dir):
-            os.makedirs(log_dir)
-
-        file_handler = RotatingFileHandler(
-            log_file,
-            maxBytes=10485760,  # 10MB
-            backupCount=5
-        )
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        logger.addHandler(QueueHandler(_get_file_queue(log_file, formatter)))
 
     return logger
 
@@ -1,11 +1,27 @@
 """System metrics collection for the outage monitoring system."""
 
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
+# Wall-clock reading shared by rapid-fire metric updates
+_NOW_CACHE_SECONDS = 0.5
+_last_now_ts: float = 0.0
+_last_now_dt: Optional[datetime] = None
 
-@dataclass
+
+def _now_cached() -> datetime:
+    """Return datetime.now(), reusing the last value for up to half a second."""
+    global _last_now_ts, _last_now_dt
+    now_ts = time.monotonic()
+    if _last_now_dt is None or now_ts - _last_now_ts >= _NOW_CACHE_SECONDS:
+        _last_now_ts = now_ts
+        _last_now_dt = datetime.now()
+    return _last_now_dt
+
+
+@dataclass(slots=True)
 class SystemMetrics:
     """System metrics data class for tracking application statistics."""
 
@@ -17,6 +33,11 @@ class SystemMetrics:
     current_outages: int = 0
     start_time: datetime = field(default_factory=datetime.now)
     last_scrape: Optional[datetime] = None
+    # Monotonic start for uptime; start_time is kept for display only
+    _start_monotonic: float = field(default_factory=time.monotonic, init=False, repr=False)
+    # Last success rate, keyed by the (total, successful) counts it was computed from
+    _rate_key: Tuple[int, int] = field(default=(0, 0), init=False, repr=False)
+    _rate: float = field(default=100.0, init=False, repr=False)
 
     def increment_scrapes(self, success: bool = True) -> None:
         """Increment scrape counter."""
@@ -25,7 +46,7 @@ class SystemMetrics:
             self.successful_scrapes += 1
         else:
             self.failed_scrapes += 1
-        self.last_scrape = datetime.now()
+        self.last_scrape = _now_cached()
 
     def increment_notifications(self, count: int = 1) -> None:
         """Increment notification counter."""
@@ -41,13 +62,18 @@ class SystemMetrics:
 
     def get_uptime_seconds(self) -> int:
         """Calculate uptime in seconds."""
-        return int((datetime.now() - self.start_time).total_seconds())
+        return int(time.monotonic() - self._start_monotonic)
 
     def get_success_rate(self) -> float:
         """Calculate scrape success rate."""
-        if self.total_scrapes == 0:
-            return 100.0
-        return (self.successful_scrapes / self.total_scrapes) * 100
+        key = (self.total_scrapes, self.successful_scrapes)
+        if key != self._rate_key:
+            self._rate_key = key
+            if self.total_scrapes == 0:
+                self._rate = 100.0
+            else:
+                self._rate = (self.successful_scrapes / self.total_scrapes) * 100
+        return self._rate
 
     def to_dict(self) -> Dict:
         """Convert to dictionary for API response."""
@@ -60,7 +86,7 @@ class SystemMetrics:
             "current_outages": self.current_outages,
             "uptime_seconds": self.get_uptime_seconds(),
             "success_rate": round(self.get_success_rate(), 2),
-            "last_scrape": self.last_scrape.isoformat() if self.last_scrape else None,
+            "last_scrape": self.last_scrape,
         }
 
     def reset(self) -> None:
@@ -71,7 +97,8 @@ class SystemMetrics:
         self.total_notifications_sent = 0
         self.services_monitored = 0
         self.current_outages = 0
-        self.start_time = datetime.now()
+        self.start_time = _now_cached()
+        self._start_monotonic = time.monotonic()
         self.last_scrape = None
 
 
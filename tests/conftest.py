@@ -1,8 +1,49 @@
 """Pytest configuration and fixtures."""
 
+import inspect
 import pytest
+import httpx
 from datetime import datetime
 from src.models import OutageReport, StatusEnum, SeverityEnum
+from src.scraper import DownDetectorScraper
+
+
+@pytest.fixture(scope="session")
+def scraper():
+    """Scraper shared across the session by tests that do not mutate its state."""
+    return DownDetectorScraper()
+
+
+@pytest.fixture
+async def mocked_scraper():
+    """
+    Factory for scrapers whose HTTP client is served by a mock transport.
+
+    Call it with a handler (sync or async, taking an ``httpx.Request``) and an
+    optional config; it returns the scraper and the list of requests it sent.
+    Scrapers are closed on teardown.
+    """
+    created = []
+
+    def make(handler, config=None):
+        requests = []
+
+        async def record(request):
+            requests.append(request)
+            response = handler(request)
+            if inspect.isawaitable(response):
+                response = await response
+            return response
+
+        scraper = DownDetectorScraper(config)
+        scraper.client = httpx.AsyncClient(transport=httpx.MockTransport(record))
+        created.append(scraper)
+        return scraper, requests
+
+    yield make
+
+    for scraper in created:
+        await scraper.close()
 
 
 @pytest.fixture
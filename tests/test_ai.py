@@ -0,0 +1,137 @@
+"""Tests for AI article generation."""
+
+import httpx
+import pytest
+from datetime import datetime
+from src.ai import AIArticleGenerator, AIConfig
+from src.models import ChangeEvent, ChangeType, StatusEnum, SeverityEnum
+
+
+def make_change(service_name: str, change_type: ChangeType) -> ChangeEvent:
+    """Helper to build a change event."""
+    return ChangeEvent(
+        change_type=change_type,
+        service_name=service_name,
+        new_status=StatusEnum.DOWN,
+        new_report_count=1500,
+        new_severity=SeverityEnum.MEDIUM,
+        timestamp=datetime.now(),
+        service_url=f"https://downdetector.com/status/{service_name.lower()}",
+    )
+
+
+class TestArticleCache:
+    """Tests for the article cache."""
+
+    @pytest.fixture
+    def generator(self):
+        """Create a generator with a small cache."""
+        return AIArticleGenerator(AIConfig(api_key="", cache_max_size=2, cache_ttl_seconds=60))
+
+    def test_cache_evicts_least_recently_used(self, generator):
+        """Test cache stays within its size limit."""
+        generator._cache_set("a", "article a")
+        generator._cache_set("b", "article b")
+        assert generator._cache_get("a") == "article a"
+
+        generator._cache_set("c", "article c")
+
+        assert generator._cache_get("b") is None
+        assert generator._cache_get("a") == "article a"
+        assert generator._cache_get("c") == "article c"
+
+    def test_cache_entries_expire(self, generator):
+        """Test expired entries are not returned."""
+        generator._cache_set("a", "article a")
+        created_at, article = generator.cache["a"]
+        generator.cache["a"] = (created_at - 61, article)
+
+        assert generator._cache_get("a") is None
+        assert "a" not in generator.cache
+
+    def test_clear_cache(self, generator):
+        """Test clearing the cache."""
+        generator._cache_set("a", "article a")
+        generator.clear_cache()
+        assert len(generator.cache) == 0
+
+
+class TestCacheKey:
+    """Tests for cache key generation."""
+
+    def test_cache_key_ignores_order(self):
+        """Test cache key is stable regardless of change order."""
+        generator = AIArticleGenerator(AIConfig(api_key=""))
+        a = make_change("Google", ChangeType.NEW_OUTAGE)
+        b = make_change("Facebook", ChangeType.REPORT_COUNT_SPIKE)
+
+        key = generator._create_cache_key([a, b])
+        assert key == generator._create_cache_key([b, a])
+        assert len(key) == 32
+
+    def test_cache_key_differs_by_change_type(self):
+        """Test different change types produce different keys."""
+        generator = AIArticleGenerator(AIConfig(api_key=""))
+        new = generator._create_cache_key([make_change("Google", ChangeType.NEW_OUTAGE)])
+        resolved = generator._create_cache_key([make_change("Google", ChangeType.OUTAGE_RESOLVED)])
+        assert new != resolved
+
+
+class TestPrepareContext:
+    """Tests for prompt context preparation."""
+
+    def test_context_deduplicates_and_caps(self):
+        """Test duplicate changes collapse and the list is capped."""
+        generator = AIArticleGenerator(AIConfig(api_key="", max_context_items=2))
+        changes = [
+            make_change("Google", ChangeType.NEW_OUTAGE),
+            make_change("Google", ChangeType.NEW_OUTAGE),
+            make_change("Facebook", ChangeType.NEW_OUTAGE),
+            make_change("Twitter", ChangeType.REPORT_COUNT_SPIKE),
+        ]
+
+        lines = generator._prepare_context(changes).splitlines()
+
+        assert len(lines) == 3  # header + 2 changes
+        assert lines[1].startswith("Facebook|new_outage|down|1500|medium|")
+        assert lines[2].startswith("Twitter|report_count_spike|")
+
+
+class TestFailureHandling:
+    """Tests for retries and the circuit breaker."""
+
+    async def test_transient_errors_are_retried(self):
+        """Test transient errors are retried until success."""
+        generator = AIArticleGenerator(AIConfig(
+            api_key="", retry_min_delay_seconds=0, retry_max_delay_seconds=0,
+        ))
+        attempts = []
+
+        async def flaky(prompt):
+            attempts.append(prompt)
+            if len(attempts) < 3:
+                raise httpx.ConnectError("boom")
+            return "article"
+
+        assert await generator._call_with_retries(flaky, "prompt") == "article"
+        assert len(attempts) == 3
+
+    async def test_repeated_failures_open_circuit(self):
+        """Test generation is skipped after repeated failures."""
+        generator = AIArticleGenerator(AIConfig(
+            api_key="", provider="openai", enable_cache=False, failure_threshold=2,
+        ))
+        generator._get_client = lambda: object()
+        calls = []
+
+        async def failing(prompt):
+            calls.append(prompt)
+            raise ValueError("bad response")
+
+        generator._call_openai = failing
+        changes = [make_change("Google", ChangeType.NEW_OUTAGE)]
+
+        assert await generator.generate_article(changes) is None
+        assert await generator.generate_article(changes) is None
+        assert await generator.generate_article(changes) is None
+        assert len(calls) == 2
@@ -1,6 +1,8 @@
 """Tests for REST API endpoints."""
 
+import time
 import pytest
+from collections import deque
 from fastapi.testclient import TestClient
 from datetime import datetime
 
@@ -55,6 +57,45 @@ class TestAPIEndpoints:
         )
         assert response.error["code"] == "NOT_FOUND"
 
+    def test_metrics_endpoint_matches_model(self):
+        """Test the /metrics payload is validated against MetricsResponse."""
+        from fastapi import FastAPI
+        from src.api import health_router
+        from src.models import MetricsResponse
+        from src.utils.metrics import metrics
+
+        app = FastAPI()
+        app.include_router(health_router)
+        metrics.increment_scrapes(success=True)
+        try:
+            client = TestClient(app)
+            data = client.get("/metrics").json()
+            schema = client.get("/openapi.json").json()
+        finally:
+            metrics.reset()
+
+        assert set(data) == set(MetricsResponse.model_fields)
+        assert MetricsResponse.model_validate(data).model_dump(mode="json") == data
+        assert isinstance(data["last_scrape"], str)
+        response_schema = schema["paths"]["/metrics"]["get"]["responses"]["200"]
+        assert response_schema["content"]["application/json"]["schema"] == {
+            "$ref": "#/components/schemas/MetricsResponse"
+        }
+
+    def test_metrics_endpoint_rejects_drifted_payload(self, monkeypatch):
+        """Test a metrics payload that no longer fits the schema fails loudly."""
+        from fastapi import FastAPI
+        from fastapi.exceptions import ResponseValidationError
+        from src.api import health_router
+        from src.utils.metrics import metrics
+
+        app = FastAPI()
+        app.include_router(health_router)
+        monkeypatch.setattr(type(metrics), "to_dict", lambda self: {"total_scrapes": -1})
+
+        with pytest.raises(ResponseValidationError):
+            TestClient(app).get("/metrics")
+
 
 class TestRateLimiter:
     """Tests for rate limiter."""
@@ -79,6 +120,156 @@ class TestRateLimiter:
         from src.middleware.rate_limiter import RateLimiter
 
         limiter = RateLimiter(requests_per_minute=100)
-        limiter.requests["127.0.0.1"] = [datetime.now()]
+        limiter._shards[limiter._shard_index("127.0.0.1")]["127.0.0.1"] = deque([time.monotonic()])
         limiter.reset()
-        assert len(limiter.requests) == 0
+        assert all(len(shard) == 0 for shard in limiter._shards)
+
+    async def test_rate_limiter_blocks_after_limit(self):
+        """Test requests over the limit are rejected."""
+        from fastapi import HTTPException, Request
+        from src.middleware.rate_limiter import RateLimiter
+
+        limiter = RateLimiter(requests_per_minute=2)
+        request = Request({"type": "http", "headers": [], "client": ("127.0.0.1", 1234)})
+
+        await limiter.check_rate_limit(request)
+        await limiter.check_rate_limit(request)
+        assert limiter.get_remaining("127.0.0.1") == 0
+
+        with pytest.raises(HTTPException) as exc_info:
+            await limiter.check_rate_limit(request)
+        assert exc_info.value.status_code == 429
+
+    async def test_rate_limiter_sweeps_idle_clients(self):
+        """Test idle clients are dropped from memory."""
+        from fastapi import Request
+        from src.middleware.rate_limiter import RateLimiter
+
+        limiter = RateLimiter(requests_per_minute=10)
+        idx = limiter._shard_index("10.0.0.1")
+        limiter._shards[idx]["10.0.0.1"] = deque([time.monotonic() - 120])
+        limiter._last_sweep -= limiter.WINDOW_SECONDS
+
+        request = Request({"type": "http", "headers": [], "client": ("127.0.0.1", 1234)})
+        await limiter.check_rate_limit(request)
+
+        assert "10.0.0.1" not in limiter._shards[idx]
+
+
+    async def test_rate_limiter_shared_storage(self):
+        """Test rate limiting through a limits storage backend."""
+        pytest.importorskip("limits")
+        from fastapi import HTTPException, Request
+        from src.middleware.rate_limiter import RateLimiter
+
+        limiter = RateLimiter(requests_per_minute=1, storage_uri="async+memory://")
+        request = Request({"type": "http", "headers": [], "client": ("127.0.0.1", 1234)})
+
+        await limiter.check_rate_limit(request)
+        with pytest.raises(HTTPException):
+            await limiter.check_rate_limit(request)
+
+
+class TestRoutesState:
+    """Tests for in-memory API state helpers."""
+
+    async def test_service_lookup_is_case_insensitive(self, sample_report):
+        """Test service status lookup ignores case."""
+        from src.api import routes
+
+        routes.set_current_state({"Google": sample_report})
+        report = await routes.get_service_status("gOOgle")
+        assert report is sample_report
+
+    async def test_changes_history_prunes_old_entries(self):
+        """Test history keeps only the last 24 hours."""
+        from datetime import timedelta
+        from src.api import routes
+
+        routes._changes_history.clear()
+        old = (datetime.now() - timedelta(hours=30)).isoformat()
+        recent = datetime.now().isoformat()
+        routes.add_changes([
+            {"service_name": "Google", "change_type": "new_outage", "timestamp": old},
+            {"service_name": "Google", "change_type": "outage_resolved", "timestamp": recent},
+        ])
+
+        assert len(routes._changes_history) == 1
+        assert routes._changes_history[0][1]["timestamp"] == recent
+
+    async def test_status_filters_use_indexes(self, multiple_reports):
+        """Test status filters select matching services."""
+        from src.api import routes
+
+        routes.set_current_state({r.service_name: r for r in multiple_reports})
+
+        response = await routes.get_all_status(
+            severity=SeverityEnum.HIGH, status=StatusEnum.ISSUES,
+        )
+        assert [s.service_name for s in response.services] == ["Facebook"]
+
+        response = await routes.get_all_status(
+            severity=SeverityEnum.CRITICAL, status=StatusEnum.UP,
+        )
+        assert response.total_count == 0
+
+        response = await routes.get_all_status(severity=None, status=None)
+        assert response.total_count == 3
+
+    async def test_recent_changes_window(self):
+        """Test /changes only returns entries inside the requested window."""
+        from datetime import timedelta
+        from src.api import routes
+
+        routes._changes_history.clear()
+        now = datetime.now()
+        routes.add_changes([
+            {
+                "change_type": "new_outage",
+                "service_name": "Google",
+                "new_status": "down",
+                "new_report_count": 15000,
+                "new_severity": "critical",
+                "timestamp": (now - timedelta(hours=hours_ago)).isoformat(),
+                "service_url": "https://downdetector.com/status/google",
+            }
+            for hours_ago in (5, 0.5)
+        ])
+
+        response = await routes.get_recent_changes(
+            hours=1, service="GOOGLE", change_type=None,
+        )
+        assert response.total_count == 1
+
+
+class TestSecurityMiddleware:
+    """Tests for security middleware configuration."""
+
+    def test_rate_limit_middleware(self):
+        """Test the middleware limits only the configured prefixes."""
+        from fastapi import FastAPI
+        from src.middleware.rate_limiter import RateLimiter
+        from src.middleware.security import configure_security
+
+        app = FastAPI()
+
+        @app.get("/api/v1/status")
+        async def status():
+            return {"ok": True}
+
+        @app.get("/api/v1/health")
+        async def health():
+            return {"ok": True}
+
+        configure_security(
+            app,
+            rate_limiter=RateLimiter(requests_per_minute=1),
+            rate_limited_prefixes=("/api/v1/status",),
+        )
+        client = TestClient(app)
+
+        assert client.get("/api/v1/status").status_code == 200
+        response = client.get("/api/v1/status")
+        assert response.status_code == 429
+        assert response.json()["detail"]["error"]["code"] == "RATE_LIMIT_EXCEEDED"
+        assert client.get("/api/v1/health").status_code == 200
@@ -126,3 +126,16 @@ class TestChangeDetector:
         # Should detect outages for Google (down) and Facebook (issues)
         outage_changes = [c for c in changes if c.change_type == ChangeType.NEW_OUTAGE]
         assert len(outage_changes) == 2
+
+    def test_changes_follow_scrape_order(self, detector, sample_down_report):
+        """Test changes come out in scrape order, then resolved in previous order."""
+        names = [f"Service {i}" for i in range(20)]
+        first = [sample_down_report.model_copy(update={"service_name": n}) for n in names]
+
+        changes = detector.detect_changes(first)
+        assert [c.service_name for c in changes] == names
+
+        # Half the services disappear; they resolve in the order they were seen
+        changes = detector.detect_changes(first[::2])
+        assert [c.service_name for c in changes] == names[1::2]
+        assert all(c.change_type == ChangeType.OUTAGE_RESOLVED for c in changes)
@@ -93,7 +93,80 @@ class TestEnums:
         assert SeverityEnum.HIGH.value == "high"
         assert SeverityEnum.CRITICAL.value == "critical"
 
+    def test_severity_enum_ordering(self):
+        """Test severity levels order by rank, not alphabetically."""
+        assert SeverityEnum.LOW < SeverityEnum.MEDIUM < SeverityEnum.HIGH < SeverityEnum.CRITICAL
+        assert SeverityEnum.HIGH >= SeverityEnum.HIGH
+        assert SeverityEnum.HIGH < "critical"
+        assert "low" < SeverityEnum.MEDIUM
+        assert max(SeverityEnum) == SeverityEnum.CRITICAL
+        assert sorted(["critical", "low", "high"], key=SeverityEnum) == ["low", "high", "critical"]
+
+    def test_severity_rank_orders_model_fields(self, sample_report, sample_down_report):
+        """Test model severity fields, stored as raw strings, order by rank."""
+        low = sample_report
+        critical = sample_down_report
+        assert isinstance(critical.severity, str)
+
+        assert SeverityEnum(critical.severity).rank > SeverityEnum(low.severity).rank
+        assert critical.severity_rank > low.severity_rank
+        assert sorted([critical, low], key=lambda r: r.severity_rank) == [low, critical]
+
+        change = ChangeEvent(
+            change_type=ChangeType.SEVERITY_INCREASED,
+            service_name="Google",
+            new_status=StatusEnum.DOWN,
+            old_severity=SeverityEnum.MEDIUM,
+            new_severity=SeverityEnum.CRITICAL,
+            new_report_count=15000,
+            service_url="https://downdetector.com/status/google",
+        )
+        assert change.new_severity_rank > change.old_severity_rank
+        initial = change.model_copy(update={"old_severity": None})
+        assert initial.old_severity_rank is None
+
+    def test_severity_enum_ordering_rejects_other_types(self):
+        """Test comparing with a non-severity raises the usual TypeError."""
+        with pytest.raises(TypeError):
+            SeverityEnum.LOW < None
+        with pytest.raises(TypeError):
+            SeverityEnum.HIGH >= 3
+        with pytest.raises(TypeError):
+            SeverityEnum.HIGH <= []
+        with pytest.raises(TypeError):
+            sorted([SeverityEnum.HIGH, None, SeverityEnum.LOW])
+        assert SeverityEnum.LOW.__lt__("unknown") is NotImplemented
+
     def test_change_type_enum(self):
         """Test change type enumeration."""
         assert ChangeType.NEW_OUTAGE.value == "new_outage"
         assert ChangeType.OUTAGE_RESOLVED.value == "outage_resolved"
+
+
+class TestModelDefaults:
+    """Tests for model default values."""
+
+    def test_timestamp_defaults_to_now(self):
+        """Test timestamp is filled in when omitted."""
+        before = datetime.now()
+        report = OutageReport(
+            service_name="Google",
+            service_url="https://downdetector.com/status/google",
+            status=StatusEnum.UP,
+            report_count=0,
+            severity=SeverityEnum.LOW,
+        )
+        assert before <= report.timestamp <= datetime.now()
+
+    def test_enum_fields_stored_as_values(self):
+        """Test enum fields hold their plain string values."""
+        report = OutageReport(
+            service_name="Google",
+            service_url="https://downdetector.com/status/google",
+            status=StatusEnum.DOWN,
+            report_count=100,
+            severity=SeverityEnum.HIGH,
+        )
+        assert type(report.status) is str
+        assert report.status == StatusEnum.DOWN
+        assert report.severity == "high"
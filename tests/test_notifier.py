@@ -0,0 +1,203 @@
+"""Tests for notification services."""
+
+import pytest
+from datetime import datetime
+from src.models import ChangeEvent, ChangeType, StatusEnum, SeverityEnum
+
+
+@pytest.fixture
+def sample_change():
+    """Create a sample change event for testing."""
+    return ChangeEvent(
+        change_type=ChangeType.NEW_OUTAGE,
+        service_name="Google",
+        new_status=StatusEnum.DOWN,
+        new_report_count=15000,
+        new_severity=SeverityEnum.CRITICAL,
+        timestamp=datetime(2025, 11, 18, 10, 25),
+        service_url="https://downdetector.com/status/google",
+    )
+
+
+class TestWebSocketNotifier:
+    """Tests for WebSocketNotifier class."""
+
+    def test_packet_json_round_trip(self, sample_change):
+        """Test the packet encoder round-trips change payloads."""
+        from src.notifier.websocket_notifier import _MsgspecJSON
+
+        payload = {"changes": [sample_change.to_dict()], "count": 1}
+        encoded = _MsgspecJSON.dumps(payload, separators=(",", ":"))
+
+        assert isinstance(encoded, str)
+        assert _MsgspecJSON.loads(encoded) == payload
+
+    def test_struct_payload_matches_model_dump(self, sample_change):
+        """Test msgspec structs encode like the pydantic JSON dump."""
+        from src.notifier.websocket_notifier import _MsgspecJSON
+
+        encoded = _MsgspecJSON.dumps({"changes": [sample_change.to_msg()]})
+
+        assert _MsgspecJSON.loads(encoded) == {"changes": [sample_change.to_dict()]}
+
+    def test_msgpack_serializer(self):
+        """Test msgpack packets can be enabled through config."""
+        pytest.importorskip("msgpack")
+        from socketio.msgpack_packet import MsgPackPacket
+        from src.notifier import WebSocketNotifier, WebSocketConfig
+
+        notifier = WebSocketNotifier(WebSocketConfig(serializer="msgpack"))
+        assert notifier.sio.packet_class is MsgPackPacket
+
+    async def test_connected_count_from_room_manager(self):
+        """Test client tracking comes from the socketio room manager."""
+        from src.notifier import WebSocketNotifier
+
+        notifier = WebSocketNotifier()
+        assert notifier.get_connected_count() == 0
+
+        sid = await notifier.sio.manager.connect("eio-1", "/")
+        assert notifier.get_connected_count() == 1
+
+        await notifier.sio.manager.disconnect(sid, "/")
+        assert notifier.get_connected_count() == 0
+
+    def test_broadcast_payload_follows_changes(self, sample_change):
+        """Test same-size change lists from one cycle get their own payloads."""
+        from src.notifier import WebSocketNotifier
+
+        notifier = WebSocketNotifier()
+        slack = sample_change.model_copy(update={"service_name": "Slack"})
+
+        assert notifier._build_payload([sample_change])["changes"][0].service_name == "Google"
+        assert notifier._build_payload([slack])["changes"][0].service_name == "Slack"
+
+
+class TestEmailNotifier:
+    """Tests for EmailNotifier class."""
+
+    @pytest.fixture
+    def notifier(self):
+        """Create an email notifier with one recipient."""
+        from src.notifier import EmailNotifier, EmailConfig
+
+        return EmailNotifier(EmailConfig(recipient_emails="ops@example.com", use_tls=False))
+
+    async def test_smtp_sessions_bounded_per_notification(self, notifier, sample_change, monkeypatch):
+        """Test services are sent over a bounded pool of SMTP connections."""
+        from src.notifier import email_notifier
+
+        connections = []
+
+        class FakeSMTP:
+            def __init__(self, *args, **kwargs):
+                self.sent = []
+                self.closed = False
+                connections.append(self)
+
+            async def connect(self):
+                pass
+
+            async def send_message(self, message):
+                self.sent.append(message)
+
+            async def quit(self):
+                self.closed = True
+
+            def close(self):
+                pass
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+        monkeypatch.setattr(email_notifier.aiosmtplib, "SMTP", FakeSMTP)
+        changes = [
+            sample_change.model_copy(update={"service_name": f"Service {i}"})
+            for i in range(7)
+        ]
+
+        assert await notifier.send_change_notification(changes)
+        assert len(connections) == notifier.config.max_concurrent_sends
+        assert sum(len(c.sent) for c in connections) == 7
+        assert all(c.closed for c in connections)
+
+        message = connections[0].sent[0]
+        assert message["To"] == "ops@example.com"
+        assert message["From"] == notifier.config.sender_email
+
+    async def test_failed_smtp_session_not_reused(self, notifier, sample_change, monkeypatch):
+        """Test a session that fails a send is closed and replaced, not pooled again."""
+        from src.notifier import email_notifier
+
+        connections = []
+
+        class FakeSMTP:
+            def __init__(self, *args, **kwargs):
+                self.sent = []
+                self.closed = False
+                self.broken = not connections  # the first session drops on send
+                connections.append(self)
+
+            async def connect(self):
+                pass
+
+            async def send_message(self, message):
+                assert not self.closed, "send on a closed session"
+                if self.broken:
+                    raise email_notifier.aiosmtplib.SMTPServerDisconnected("dropped")
+                self.sent.append(message)
+
+            async def quit(self):
+                self.closed = True
+
+            def close(self):
+                self.closed = True
+
+        monkeypatch.setattr(email_notifier.aiosmtplib, "SMTP", FakeSMTP)
+        notifier.config.max_concurrent_sends = 1
+        changes = [
+            sample_change.model_copy(update={"service_name": f"Service {i}"})
+            for i in range(3)
+        ]
+
+        assert not await notifier.send_change_notification(changes)
+        assert len(connections) == 2
+        assert connections[0].closed and connections[0].sent == []
+        assert len(connections[1].sent) == 2
+        assert connections[1].closed
+
+    def test_basic_html_lists_every_change(self, notifier, sample_change):
+        """Test fallback HTML renders one block per change."""
+        other = sample_change.model_copy(update={"new_report_count": 12345})
+
+        html = notifier._generate_basic_html("Google", [sample_change, other], "Resumo")
+
+        assert html.count("border-left: 3px solid #f44336") == 2
+        assert "Report Count: 12,345" in html
+        assert "AI Summary" in html
+        assert sample_change.service_url in html
+
+    def test_templates_resolved_at_init(self, notifier):
+        """Test both email templates are loaded once up front."""
+        assert notifier._tpl_ai is not None
+        assert notifier._tpl_basic is not None
+        assert notifier.template_env.auto_reload is False
+
+    def test_subject_for_change_type(self, notifier, sample_change):
+        """Test subject lines are picked per change type."""
+        assert notifier._generate_subject("Google", sample_change) == "[ALERT] Google is experiencing issues"
+
+    def test_template_renders_enum_values(self, notifier, sample_change):
+        """Test templates print plain change type and status strings."""
+        html = notifier._tpl_basic.render(
+            service_name="Google",
+            changes=[sample_change],
+            primary_change=sample_change,
+            timestamp=sample_change.timestamp,
+        )
+
+        assert "new outage" in html
+        assert "status-down" in html
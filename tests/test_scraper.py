@@ -1,10 +1,53 @@
 """Tests for scraper service."""
 
+import httpx
 import pytest
+from selectolax.lexbor import LexborHTMLParser
 from src.scraper import DownDetectorScraper, ScraperConfig
+from src.scraper import downdetector_scraper
+from src.scraper.downdetector_scraper import get_shared_client, shutdown_shared_client
 from src.models import SeverityEnum
 
 
+SAMPLE_PAGE = """
+<html>
+<head><meta name="description" content="Google outage map"></head>
+<body>
+  <h1 class="entry-title">User reports indicate problems at Google</h1>
+  <div class="reports-count">12,345 reports</div>
+  <ul>
+    <li class="city-item">New York</li>
+    <li class="city-item">London</li>
+    <li class="city-item">New York</li>
+  </ul>
+  <div class="entry-content"><p>Users are reporting problems with Search and Gmail.</p></div>
+</body>
+</html>
+"""
+
+
+@pytest.fixture(autouse=True)
+async def reset_shared_client():
+    """Give each test a fresh shared client and close it on the test's loop."""
+    await shutdown_shared_client()
+    yield
+    await shutdown_shared_client()
+
+
+@pytest.fixture
+def client_kwargs(monkeypatch):
+    """Record the keyword arguments the shared client is built with."""
+    captured = []
+    real_client = httpx.AsyncClient
+
+    def recording_client(*args, **kwargs):
+        captured.append(kwargs)
+        return real_client(*args, **kwargs)
+
+    monkeypatch.setattr(downdetector_scraper.httpx, "AsyncClient", recording_client)
+    return captured
+
+
 class TestScraperConfig:
     """Tests for scraper configuration."""
 
@@ -27,65 +70,305 @@ class TestScraperConfig:
         """Test services list parsing with spaces."""
         config = ScraperConfig(monitored_services="google, facebook , twitter")
         services = config.services_list
-        assert services == ["google", "facebook", "twitter"]
+        assert services == ("google", "facebook", "twitter")
+
+    def test_services_list_cached(self):
+        """Test services list is parsed once per config."""
+        config = ScraperConfig(monitored_services="google,facebook")
+        assert config.services_list is config.services_list
 
 
 class TestDownDetectorScraper:
     """Tests for DownDetectorScraper class."""
 
-    def test_scraper_initialization(self):
-        """Test scraper initialization."""
+    async def test_scraper_initialization(self):
+        """Test scraper attaches to a persistent keep-alive client."""
         scraper = DownDetectorScraper()
         assert scraper.BASE_URL == "https://downdetector.com"
+        assert scraper.config.max_connections == 100
+        assert scraper.config.max_keepalive == 64
+        assert not hasattr(scraper, "__dict__")
+
+        client = await scraper._get_client()
+        assert await scraper._get_client() is client
+        assert not client.is_closed
+
+        await scraper.aclose()
         assert scraper.client is None
 
-    def test_severity_calculation(self):
-        """Test severity calculation based on report count."""
-        scraper = DownDetectorScraper()
+    async def test_scrapers_share_http_client(self):
+        """Test scrapers reuse one HTTP client that survives close()."""
+        first, second = DownDetectorScraper(), DownDetectorScraper()
+        client = await first._get_client()
 
-        assert scraper._calculate_severity(500) == SeverityEnum.LOW
-        assert scraper._calculate_severity(1500) == SeverityEnum.MEDIUM
-        assert scraper._calculate_severity(6000) == SeverityEnum.HIGH
-        assert scraper._calculate_severity(15000) == SeverityEnum.CRITICAL
+        assert await second._get_client() is client
+        await first.close()
+        assert not client.is_closed
 
-    def test_severity_boundaries(self):
-        """Test severity calculation at boundaries."""
-        scraper = DownDetectorScraper()
+        await shutdown_shared_client()
+        assert client.is_closed
+
+    @pytest.mark.parametrize("count,expected", [
+        (500, SeverityEnum.LOW),
+        (999, SeverityEnum.LOW),
+        (1000, SeverityEnum.LOW),
+        (1001, SeverityEnum.MEDIUM),
+        (1500, SeverityEnum.MEDIUM),
+        (5000, SeverityEnum.MEDIUM),
+        (5001, SeverityEnum.HIGH),
+        (6000, SeverityEnum.HIGH),
+        (10000, SeverityEnum.HIGH),
+        (10001, SeverityEnum.CRITICAL),
+        (15000, SeverityEnum.CRITICAL),
+    ])
+    def test_severity(self, scraper, count, expected):
+        """Test severity calculation, including the threshold boundaries."""
+        assert scraper._calculate_severity(count) == expected
+
+    def test_parse_service_page(self, scraper):
+        """Test extracting a report from a service page."""
+        tree = LexborHTMLParser(SAMPLE_PAGE)
+
+        report = scraper._parse_service_page(tree, "google", "https://downdetector.com/status/google")
+
+        assert report.status == "down"
+        assert report.report_count == 12345
+        assert report.severity == SeverityEnum.CRITICAL
+        assert report.affected_regions == ["New York", "London"]
+        assert report.description == "Users are reporting problems with Search and Gmail."
+
+    def test_parse_service_page_throughput(self, benchmark, scraper):
+        """Benchmark parsing a full-size (~200 KB) service page."""
+        filler = "".join(
+            f'<div class="comment"><p>Comment {i}: still seeing errors on login</p></div>'
+            for i in range(2800)
+        )
+        html = SAMPLE_PAGE.replace("</body>", f"{filler}</body>").encode()
+        assert len(html) > 200_000
+
+        def parse():
+            tree = LexborHTMLParser(html)
+            return scraper._parse_service_page(tree, "google", "https://downdetector.com/status/google")
+
+        report = benchmark.pedantic(parse, rounds=5, iterations=1)
+
+        assert report.report_count == 12345
+        assert report.affected_regions == ["New York", "London"]
+
+    def test_extract_status_keywords(self, scraper):
+        """Test status keywords in the page title."""
+        def status(title):
+            return scraper._extract_status(LexborHTMLParser(f"<h1>{title}</h1>"))
+
+        assert status("Reported OUTAGE at Google") == "down"
+        assert status("Warning: elevated reports") == "issues"
+        assert status("Everything looks fine") == "up"
+
+    def test_report_count_fallback_scans_page_text(self, scraper):
+        """Test the report count falls back to the visible page text."""
+        html = "<html><body><p>About <b>2,500</b> reports in the last hour</p></body></html>"
+
+        assert scraper._extract_report_count(LexborHTMLParser(html)) == 2500
+
+    def test_report_count_fallback_ignores_scripts_and_attributes(self, scraper):
+        """Test numbers in scripts, styles and attributes are not taken as counts."""
+        html = (
+            '<html><head><script>var cfg = {"label": "1 user"};</script></head>'
+            '<body><script>track("5 users")</script><style>/* 3 reports */</style>'
+            '<div data-note="9 reports">No data yet</div></body></html>'
+        )
+
+        assert scraper._extract_report_count(LexborHTMLParser(html)) == 0
+
+    async def test_scrape_all_services_concurrently(self, monkeypatch):
+        """Test services are scraped in parallel within the limit, keeping order."""
+        import asyncio
+
+        scraper = DownDetectorScraper(ScraperConfig(monitored_services="a,b,c,d", max_concurrency=2))
+        active = 0
+        peak = 0
+
+        async def fake_scrape(self, service):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            tree = LexborHTMLParser(SAMPLE_PAGE)
+            return self._parse_service_page(tree, service, f"{self.BASE_URL}/status/{service}")
+
+        monkeypatch.setattr(DownDetectorScraper, "scrape_service", fake_scrape)
+
+        reports = await scraper.scrape_all_services()
+
+        assert [r.service_name for r in reports] == ["A", "B", "C", "D"]
+        assert peak == 2
+
+    async def test_service_requests_overlap(self, mocked_scraper):
+        """Test ten service fetches take about one request's latency, not ten."""
+        import asyncio
+        import time
+
+        latency = 0.1
+
+        async def handler(request):
+            await asyncio.sleep(latency)
+            return httpx.Response(200, text=SAMPLE_PAGE)
+
+        services = ",".join(f"service{i}" for i in range(10))
+        scraper, requests = mocked_scraper(handler, ScraperConfig(monitored_services=services))
+
+        started = time.monotonic()
+        reports = await scraper.scrape_all_services()
+        elapsed = time.monotonic() - started
 
-        assert scraper._calculate_severity(999) == SeverityEnum.LOW
-        assert scraper._calculate_severity(1000) == SeverityEnum.LOW
-        assert scraper._calculate_severity(1001) == SeverityEnum.MEDIUM
-        assert scraper._calculate_severity(5000) == SeverityEnum.MEDIUM
-        assert scraper._calculate_severity(5001) == SeverityEnum.HIGH
-        assert scraper._calculate_severity(10000) == SeverityEnum.HIGH
-        assert scraper._calculate_severity(10001) == SeverityEnum.CRITICAL
+        assert len(reports) == len(requests) == 10
+        assert elapsed < 2 * latency
+
+    async def test_shared_client_keeps_connections_alive(self, client_kwargs):
+        """Test the shared client pools connections with the configured limits."""
+        await get_shared_client(ScraperConfig(max_connections=20, max_keepalive=8))
+
+        limits = client_kwargs[-1]["limits"]
+        assert limits.max_connections == 20
+        assert limits.max_keepalive_connections == 8
+
+    async def test_shared_client_http2(self, client_kwargs, monkeypatch):
+        """Test HTTP/2 follows the config flag and needs the h2 package."""
+        monkeypatch.setattr(downdetector_scraper, "_HTTP2_AVAILABLE", True)
+        await get_shared_client(ScraperConfig(http2=True))
+        assert client_kwargs[-1]["http2"] is True
+        await shutdown_shared_client()
+
+        await get_shared_client(ScraperConfig(http2=False))
+        assert client_kwargs[-1]["http2"] is False
+        await shutdown_shared_client()
+
+        # Without h2 installed the client stays on HTTP/1.1
+        monkeypatch.setattr(downdetector_scraper, "_HTTP2_AVAILABLE", False)
+        await get_shared_client(ScraperConfig(http2=True))
+        assert client_kwargs[-1]["http2"] is False
+
+    async def test_concurrent_scrapes_share_request(self, mocked_scraper):
+        """Test concurrent scrapes of one service issue a single request."""
+        import asyncio
+
+        async def handler(request):
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, text=SAMPLE_PAGE)
+
+        scraper, requests = mocked_scraper(handler)
+
+        reports = await asyncio.gather(*(scraper.scrape_service("google") for _ in range(10)))
+
+        assert len(requests) == 1
+        assert all(r.report_count == 12345 for r in reports)
+        assert scraper._inflight == {}
+
+    async def test_not_modified_reuses_report(self, mocked_scraper):
+        """Test a 304 response reuses the last parsed report."""
+
+        def handler(request):
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, text=SAMPLE_PAGE, headers={"ETag": '"v1"'})
+
+        scraper, requests = mocked_scraper(handler, ScraperConfig(page_cache_ttl_seconds=0))
+
+        first = await scraper.scrape_service("google")
+        second = await scraper.scrape_service("google")
+
+        assert "If-None-Match" not in requests[0].headers
+        assert requests[1].headers["If-None-Match"] == '"v1"'
+        assert second.report_count == first.report_count == 12345
+        assert second.timestamp >= first.timestamp
+
+    async def test_cache_hit_skips_network(self, mocked_scraper):
+        """Test a second scrape inside the page cache TTL issues no request."""
+
+        scraper, requests = mocked_scraper(
+            lambda request: httpx.Response(200, text=SAMPLE_PAGE),
+            ScraperConfig(page_cache_ttl_seconds=60),
+        )
+
+        first = await scraper.scrape_service("google")
+        second = await scraper.scrape_service("google")
+
+        assert len(requests) == 1
+        assert second.report_count == first.report_count == 12345
+        assert second is not first
+
+    async def test_brotli_page_decoded(self, mocked_scraper):
+        """Test br-compressed pages are negotiated and decoded before parsing."""
+        brotli = pytest.importorskip("brotli")
+
+        def handler(request):
+            return httpx.Response(
+                200,
+                content=brotli.compress(SAMPLE_PAGE.encode()),
+                headers={"Content-Encoding": "br"},
+            )
+
+        scraper, requests = mocked_scraper(handler)
+        shared = await get_shared_client(scraper.config)
+        assert "br" in shared.headers["Accept-Encoding"]
+
+        report = await scraper.scrape_service("google")
+
+        assert "br" in requests[0].headers["Accept-Encoding"]
+        assert report.report_count == 12345
+
+    async def test_not_found_service_skipped(self, mocked_scraper):
+        """Test a 404 service is not fetched again while cached."""
+
+        scraper, requests = mocked_scraper(lambda request: httpx.Response(404))
+
+        assert await scraper.scrape_service("missing") is None
+        assert await scraper.scrape_service("missing") is None
+
+        assert len(requests) == 1
 
 
 class TestStatusParsing:
     """Tests for status parsing logic."""
 
-    def test_parse_status_down(self):
+    def test_parse_status_down(self, scraper):
         """Test parsing down status."""
-        scraper = DownDetectorScraper()
-
         assert scraper._parse_status("Major outage").value == "down"
         assert scraper._parse_status("Service down").value == "down"
         assert scraper._parse_status("problem detected").value == "down"
 
-    def test_parse_status_issues(self):
+    def test_parse_status_issues(self, scraper):
         """Test parsing issues status."""
-        scraper = DownDetectorScraper()
-
         assert scraper._parse_status("Possible problems").value == "issues"
         assert scraper._parse_status("Warning detected").value == "issues"
 
-    def test_parse_status_up(self):
+    def test_parse_status_up(self, scraper):
         """Test parsing up status."""
-        scraper = DownDetectorScraper()
-
         assert scraper._parse_status("No problems").value == "up"
         assert scraper._parse_status("All systems operational").value == "up"
 
+    def test_parse_status_throughput(self, benchmark, scraper):
+        """Benchmark status parsing over a batch of page headlines."""
+        samples = [
+            ("No problems at Google", "up"),
+            ("Major outage reported", "down"),
+            ("User reports indicate problems at Facebook", "down"),
+            ("Possible problems at Twitter", "issues"),
+            ("All systems operational", "up"),
+            ("Warning: elevated error rates", "issues"),
+        ]
+        strings = [text for text, _ in samples] * 1700
+        expected = [status for _, status in samples] * 1700
+
+        results = benchmark.pedantic(
+            lambda: [scraper._parse_status(s) for s in strings],
+            rounds=5,
+            iterations=1,
+        )
+
+        assert results == expected
+
     def _parse_status(self, text: str):
         """Helper to test status parsing."""
         from src.models import StatusEnum
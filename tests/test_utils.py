@@ -0,0 +1,35 @@
+"""Tests for utility helpers."""
+
+import threading
+import time
+
+from src.utils.logger import setup_logger
+
+
+class TestLogger:
+    """Tests for logger setup."""
+
+    def test_loggers_share_one_file_writer(self, tmp_path):
+        """Test loggers writing to one file share its queue and listener thread."""
+        log_file = tmp_path / "logs" / "app.log"
+        threads_before = threading.active_count()
+
+        first = setup_logger("test_utils.first", str(log_file))
+        second = setup_logger("test_utils.second", str(log_file))
+
+        assert threading.active_count() == threads_before + 1
+        assert second.handlers[-1].queue is first.handlers[-1].queue
+
+        first.info("from first")
+        second.info("from second")
+
+        # The listener writes from its own thread; give it a moment
+        deadline = time.monotonic() + 2
+        while time.monotonic() < deadline:
+            content = log_file.read_text() if log_file.exists() else ""
+            if "from second" in content:
+                break
+            time.sleep(0.01)
+
+        assert "test_utils.first - INFO - from first" in content
+        assert "test_utils.second - INFO - from second" in content